@@ -322,8 +322,7 @@ class CommunityFeatures(commands.Cog):
         # Check if reaction roles feature is enabled
         setup_cog = self.bot.get_cog('Setup')
         if setup_cog and interaction.guild:
-            config = setup_cog.get_server_config(interaction.guild.id)
-            if not config.get('features', {}).get('reaction_roles', False):
+            if not setup_cog.is_feature_enabled(interaction.guild.id, 'reaction_roles'):
                 embed = discord.Embed(
                     title="❌ Feature Disabled",
                     description="Reaction roles are currently disabled on this server.\n"
@@ -441,8 +440,7 @@ class CommunityFeatures(commands.Cog):
         # Check if reaction roles feature is enabled
         setup_cog = self.bot.get_cog('Setup')
         if setup_cog and interaction.guild:
-            config = setup_cog.get_server_config(interaction.guild.id)
-            if not config.get('features', {}).get('reaction_roles', False):
+            if not setup_cog.is_feature_enabled(interaction.guild.id, 'reaction_roles'):
                 embed = discord.Embed(
                     title="❌ Feature Disabled",
                     description="Reaction roles are currently disabled on this server.\n"
@@ -662,8 +660,7 @@ class CommunityFeatures(commands.Cog):
         if payload.guild_id:
             setup_cog = self.bot.get_cog('Setup')
             if setup_cog:
-                config = setup_cog.get_server_config(payload.guild_id)
-                if not config.get('features', {}).get('reaction_roles', False):
+                if not setup_cog.is_feature_enabled(payload.guild_id, 'reaction_roles'):
                     return
             
         message_id = str(payload.message_id)
@@ -712,8 +709,7 @@ class CommunityFeatures(commands.Cog):
         if payload.guild_id:
             setup_cog = self.bot.get_cog('Setup')
             if setup_cog:
-                config = setup_cog.get_server_config(payload.guild_id)
-                if not config.get('features', {}).get('reaction_roles', False):
+                if not setup_cog.is_feature_enabled(payload.guild_id, 'reaction_roles'):
                     return
         
         message_id = str(payload.message_id)
@@ -10,7 +10,7 @@ from discord.ext import commands
 from discord import app_commands
 import datetime
 from typing import Dict, Any
-import pytz
+from zoneinfo import ZoneInfo
 from utils.security import SecurityValidator, SecureError
 from utils.secure_files import get_secure_ranking_handler
 from utils.cache import bot_cache
@@ -24,7 +24,7 @@ class RankingSystem(commands.Cog):
         self.user_data = self.load_data()
         
         # EDT timezone
-        self.edt = pytz.timezone('America/New_York')
+        self.edt = ZoneInfo('America/New_York')
         
         # Rank thresholds (points needed to reach each rank)
         # Designed so max rank (15-ply) takes about a year of active participation
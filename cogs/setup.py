@@ -3,14 +3,290 @@ Setup Commands Cog
 Configures the bot for new servers with interactive setup
 """
 
-import json
+import copy
+import logging
 import os
+import string
+import tempfile
+import time
+import asyncio
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional, Set, Tuple, TypedDict
+from itertools import islice
 import datetime
-import pytz
+from types import MappingProxyType
+from zoneinfo import ZoneInfo
+
+bot_logger = logging.getLogger('7ply_bot')
+
+# Config (de)serialization - orjson when available, stdlib json otherwise
+try:
+    import orjson
+    
+    def _dump_json(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    
+    _load_json = orjson.loads
+except ImportError:
+    import json
+    
+    def _dump_json(data: Any) -> bytes:
+        return (json.dumps(data, indent=2) + "\n").encode('utf-8')
+    
+    _load_json = json.loads
+
+# Read-only default welcome settings for servers without a welcome_config
+_DEFAULT_WELCOME = MappingProxyType({
+    "custom_message": None,
+    "use_embed": True,
+    "embed_color": "00ff00",
+    "ping_user": True,
+    "show_server_info": True
+})
+
+# Placeholders a custom welcome message template may use
+_ALLOWED_PLACEHOLDERS = frozenset({"user", "user_name", "server", "member_count", "date"})
+
+# Status emoji and labels for rendering boolean settings, indexed by bool
+_CHECK = ("❌", "✅")
+_STATUS_LABEL = ("❌ Disabled", "✅ Enabled")
+# Toggle button (label prefix, style) offered for a feature, indexed by whether it's currently enabled
+_TOGGLE_BUTTON = (("✅ Enable", discord.ButtonStyle.green), ("❌ Disable", discord.ButtonStyle.red))
+
+# Optional features shown in the feature selection display: (key, label, emoji)
+_FEATURE_ROWS = (
+    ("suggestions_system", "Suggestions System", "💡"),
+    ("welcome_messages", "Welcome Messages", "👋"),
+    ("temp_voice", "Temp Voice Channels", "🔊"),
+    ("reaction_roles", "Reaction Roles", "🎭"),
+)
+
+# Boolean welcome settings shown in settings displays: (key, label, emoji)
+_WELCOME_SETTING_ROWS = (
+    ("use_embed", "Use Embed", "📋"),
+    ("ping_user", "Ping User", "🔔"),
+    ("show_server_info", "Show Server Info", "📊"),
+)
+
+# Existing channel names adopted as the ranking channel during setup
+_RANK_CHANNEL_NAMES = frozenset({"rank", "ranks", "ranking"})
+# Existing channel names adopted as the welcome channel during setup
+_WELCOME_CHANNEL_NAMES = frozenset({"general", "welcome", "lobby", "main"})
+# Substrings marking an existing category as the temp voice category
+_TEMP_VOICE_KEYWORDS = ("voice", "temp")
+# Seconds to coalesce rapid config changes into one write
+_SAVE_DELAY = 3
+# Seconds an untouched /setup feature selection is kept before it counts as abandoned
+_PENDING_SETUP_TTL = 15 * 60
+
+class FeaturesConfig(TypedDict, total=False):
+    """Per-server feature toggles"""
+    ranking_system: bool
+    suggestions_system: bool
+    welcome_messages: bool
+    temp_voice: bool
+    reaction_roles: bool
+
+class WelcomeConfig(TypedDict, total=False):
+    """Per-server welcome message settings"""
+    custom_message: Optional[str]
+    use_embed: bool
+    embed_color: str
+    ping_user: bool
+    show_server_info: bool
+
+class ServerConfig(TypedDict, total=False):
+    """Schema of a single server's entry in server_configs.json"""
+    rank_channel: Optional[int]
+    ranking_channel_id: Optional[int]
+    suggestions_channel: Optional[int]
+    welcome_channel: Optional[int]
+    temp_voice_category: Optional[int]
+    features: FeaturesConfig
+    welcome_config: WelcomeConfig
+    setup_completed: bool
+    setup_in_progress: bool
+    setup_date: Optional[str]
+
+# Read-only template for newly seen servers - use _new_config() for a mutable copy
+_DEFAULT_CONFIG = MappingProxyType({
+    "rank_channel": None,
+    "suggestions_channel": None,
+    "welcome_channel": None,
+    "temp_voice_category": None,
+    "features": {
+        "ranking_system": True,      # Core feature - always enabled
+        "suggestions_system": False, # Optional
+        "welcome_messages": False,   # Optional
+        "temp_voice": False,         # Optional
+        "reaction_roles": False      # Optional
+    },
+    "welcome_config": {
+        "custom_message": None,      # Custom welcome message template
+        "use_embed": True,          # Use embed vs plain message
+        "embed_color": "00ff00",    # Hex color for embed
+        "ping_user": True,          # Whether to ping the new user
+        "show_server_info": True    # Show server member count etc
+    },
+    "setup_completed": False,
+    "setup_date": None
+})
+
+# Pre-serialized default - parsing it back is cheaper than deep-copying the nested dicts
+_DEFAULT_CONFIG_JSON = _dump_json(dict(_DEFAULT_CONFIG))
+
+# Stand-in for servers with no stored config on read-only lookups
+_EMPTY_CONFIG = MappingProxyType({})
+
+def _new_config() -> ServerConfig:
+    """Create a fresh, independent server configuration from the default template"""
+    return _load_json(_DEFAULT_CONFIG_JSON)
+
+def _format_welcome_settings(welcome_config: WelcomeConfig) -> str:
+    """Render the current welcome settings as one line per option"""
+    lines = [f"{emoji} {label}: {_CHECK[bool(welcome_config.get(key, True))]}" for key, label, emoji in _WELCOME_SETTING_ROWS]
+    lines.append(f"🎨 Embed Color: #{welcome_config.get('embed_color', '00ff00')}")
+    return "\n".join(lines)
+
+def _rank_channel_overwrites(guild: discord.Guild) -> Dict[Any, discord.PermissionOverwrite]:
+    """Permission overwrites for the ranking channel: read-only for members, full posting for the bot"""
+    overwrites = {
+        guild.default_role: discord.PermissionOverwrite(
+            send_messages=False,  # Users can't chat here
+            add_reactions=True,   # But can react to rank posts
+            read_messages=True    # Can view rankings
+        )
+    }
+    if guild.me:
+        overwrites[guild.me] = discord.PermissionOverwrite(
+            send_messages=True,
+            embed_links=True,
+            attach_files=True,
+            read_messages=True
+        )
+    return overwrites
+
+# Static embed templates - copied per use so only dynamic fields are built
+_SETUP_BASE_EMBED = {
+    "title": "🛹 7-Ply Bot Setup",
+    "description": "Let's configure the bot for your server!",
+    "color": 0x00ff88,
+    "fields": [
+        {
+            "name": "🎯 Available Features:",
+            "value": "🏆 **Ranking System** - User progression and points (Always included)\n💡 **Suggestions System** - Community feedback with voting\n👋 **Welcome Messages** - Greet new members\n🔊 **Temp Voice Channels** - User-managed voice rooms\n🎭 **Reaction Roles** - Self-serve skateboard-themed roles",
+            "inline": False
+        },
+        {
+            "name": "🔧 Requirements:",
+            "value": "• You need **Administrator** permissions\n• Bot needs permission to create/manage channels\n• Bot needs permission to send messages and embeds",
+            "inline": False
+        }
+    ],
+    "footer": {"text": "Click the button below to start setup!"}
+}
+
+_WELCOME_CONFIG_EMBED = {
+    "title": "👋 Welcome Message Configuration",
+    "description": "Customize how 7-Ply greets new members!",
+    "color": 0x00ff88,
+    "fields": [
+        {
+            "name": "🎨 Available Variables:",
+            "value": "`{user}` - Mentions the new user\n`{user_name}` - User's display name\n`{server}` - Server name\n`{member_count}` - Current member count\n`{date}` - Current date",
+            "inline": False
+        },
+        {
+            "name": "🛠️ How to Customize:",
+            "value": "Use `/welcome_set_message` to change the message template\nUse `/welcome_settings` to adjust display options",
+            "inline": False
+        }
+    ]
+}
+
+# /setup_edit menu - the "Current Settings" field is inserted first per call
+_SETUP_EDIT_EMBED = {
+    "title": "🔧 Edit Bot Settings",
+    "description": "Choose what you'd like to modify:",
+    "color": 0x00ff88,
+    "fields": [
+        {
+            "name": "💡 What can you edit?",
+            "value": "• Change channel assignments\n• Enable/disable features\n• Modify welcome message settings\n• Update any configuration without losing other settings",
+            "inline": False
+        }
+    ]
+}
+
+_EDIT_STATUS_TEMPLATE = (
+    "🏆 **Ranking Channel**: {ranking_channel}\n"
+    "💡 **Suggestions**: {suggestions}\n"
+    "👋 **Welcome Messages**: {welcome}\n"
+    "🔊 **Temp Voice**: {temp_voice}\n"
+    "🎭 **Reaction Roles**: {reaction_roles}"
+)
+
+_STATUS_FEATURES_FIELD = {
+    "name": "🛹 Available Features",
+    "value": "✅ Ranking System\n✅ Skateboard Commands\n✅ Trick Database\n✅ User Progression",
+    "inline": False
+}
+
+# Fully static - built once at import and sent as-is, so never mutate it
+_FEATURE_SELECT_EMBED = discord.Embed.from_dict({
+    "title": "🛹 7-Ply Bot Setup - Feature Selection",
+    "description": "Choose which features you want to enable:",
+    "color": 0x00ff88,
+    "fields": [
+        {
+            "name": "📋 Available Features:",
+            "value": "🏆 **Ranking System** ✅ (Always enabled)\n💡 **Suggestions System** ❌\n👋 **Welcome Messages** ❌\n🔊 **Temp Voice Channels** ❌",
+            "inline": False
+        },
+        {
+            "name": "💡 Click buttons to toggle features, then proceed!",
+            "value": "• **Suggestions** - Community feedback system with voting\n• **Welcome** - Greet new members with skateboard flair\n• **Temp Voice** - Auto-managed voice channels for sessions",
+            "inline": False
+        }
+    ]
+})
+
+# Feature selection display - the "Selected Features" field is inserted first per update
+_FEATURE_SELECTION_EMBED = {
+    "title": "🛹 7-Ply Bot Setup - Feature Selection",
+    "description": "Choose which features you want to enable:",
+    "color": 0x00ff88,
+    "fields": [
+        {
+            "name": "💡 Feature Descriptions:",
+            "value": "• **Suggestions** - Community feedback system with voting\n• **Welcome** - Greet new members with skateboard flair\n• **Temp Voice** - Auto-managed voice channels for sessions",
+            "inline": False
+        }
+    ]
+}
+
+# Setup result - the "Configured Channels/Features" field is inserted first per run
+_SETUP_SUCCESS_EMBED = {
+    "title": "✅ Setup Complete!",
+    "description": "Your server is now configured for 7-Ply Bot!",
+    "color": 0x00ff00,
+    "fields": [
+        {
+            "name": "🎯 Next Steps:",
+            "value": "• Members can start earning points by chatting\n• Use `/rank` to check progress\n• Use `/help` to see all available commands\n• Try `/trick` or `/skatefact` for skateboard content!",
+            "inline": False
+        }
+    ],
+    "footer": {"text": "Setup completed successfully! 🛹"}
+}
+
+# Welcome settings display - see SetupSystem.build_welcome_settings_embed
+_WELCOME_SETTINGS_EMBED = {
+    "title": "⚙️ Welcome Message Settings",
+    "color": 0x00ff88
+}
 
 class SetupSystem(commands.Cog):
     """Server setup and configuration commands"""
@@ -18,101 +294,171 @@ class SetupSystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.config_file = "data/server_configs.json"
-        self.server_configs = self.load_configs()
+        os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+        self.server_configs: Dict[str, ServerConfig] = {}  # Loaded in cog_load
         # EDT timezone
-        self.edt = pytz.timezone('America/New_York')
+        self.edt = ZoneInfo('America/New_York')
+        
+        # Debounced persistence - guilds with unsaved changes and the pending flush task
+        self._dirty_guilds: Set[int] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Serializes file writes so an older snapshot can never replace a newer one
+        self._save_lock = asyncio.Lock()
+        
+        # In-flight /setup feature selections keyed by setup message ID, as (last touched, selection),
+        # oldest first so abandoned sessions can be pruned from the front
+        self._pending_setups: Dict[int, Tuple[float, Dict[str, bool]]] = {}
+    
+    async def cog_load(self):
+        """Load server configs off the event loop"""
+        self.server_configs = await asyncio.to_thread(self.load_configs)
+    
+    async def cog_unload(self):
+        """Write any pending changes"""
+        # A pending flush task is only ever sleeping - it detaches before writing - so cancelling it loses nothing
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        # Write unconditionally - _save_lock queues this behind any write already in flight,
+        # so the file ends up holding the latest state
+        if await self.save_configs():
+            self._dirty_guilds.clear()
+    
+    def start_pending_setup(self, message_id: int):
+        """Begin a fresh feature selection for a /setup message, dropping abandoned ones"""
+        cutoff = time.monotonic() - _PENDING_SETUP_TTL
+        for stale_id, (touched, _) in list(self._pending_setups.items()):
+            if touched >= cutoff:
+                break
+            del self._pending_setups[stale_id]
+        self._pending_setups[message_id] = (time.monotonic(), {"ranking_system": True})  # Ranking always enabled
+    
+    def get_pending_setup(self, message_id: int) -> Optional[Dict[str, bool]]:
+        """Get the live feature selection for a /setup message and refresh its expiry, or None if it's gone"""
+        entry = self._pending_setups.pop(message_id, None)
+        if entry is None or entry[0] < time.monotonic() - _PENDING_SETUP_TTL:
+            return None
+        self._pending_setups[message_id] = (time.monotonic(), entry[1])
+        return entry[1]
+    
+    @staticmethod
+    def embed_from_template(template: Dict[str, Any]) -> discord.Embed:
+        """Build a fresh embed from a static template dict"""
+        return discord.Embed.from_dict(copy.deepcopy(template))
+    
+    def build_welcome_settings_embed(self, welcome_config: WelcomeConfig, description: str) -> discord.Embed:
+        """Build the welcome settings embed showing the current toggle states"""
+        embed = self.embed_from_template(_WELCOME_SETTINGS_EMBED)
+        embed.description = description
+        embed.add_field(
+            name="Current Settings:",
+            value=_format_welcome_settings(welcome_config),
+            inline=False
+        )
+        return embed
     
     def get_edt_now(self) -> datetime.datetime:
         """Get current time in EDT"""
         return datetime.datetime.now(self.edt)
     
-    def load_configs(self) -> Dict[str, Any]:
+    def load_configs(self) -> Dict[str, ServerConfig]:
         """Load server configurations from JSON file"""
-        if not os.path.exists("data"):
-            os.makedirs("data")
-        
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading server configs: {e}")
-                return {}
-        return {}
-    
-    def save_configs(self):
-        """Save server configurations to JSON file"""
         try:
-            if not os.path.exists("data"):
-                os.makedirs("data")
-            with open(self.config_file, 'w') as f:
-                json.dump(self.server_configs, f, indent=2)
-        except Exception as e:
-            print(f"Error saving server configs: {e}")
+            with open(self.config_file, 'rb') as f:
+                return _load_json(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            bot_logger.exception("Error loading server configs")
+            return {}
+    
+    def _write_configs(self, data: bytes):
+        """Atomically replace the config file with already-serialized data (blocking)"""
+        # Write to a temp file in the same directory, then swap it in so readers never see a partial file
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.config_file),
+            prefix=f".{os.path.basename(self.config_file)}.tmp"
+        )
+        try:
+            with os.fdopen(temp_fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.config_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    
+    async def save_configs(self) -> bool:
+        """Save server configurations to JSON file without blocking the event loop, returning whether it succeeded"""
+        try:
+            # Serialize on the loop so the snapshot is consistent, then do the disk I/O in a worker thread
+            data = _dump_json(self.server_configs)
+            async with self._save_lock:
+                await asyncio.to_thread(self._write_configs, data)
+            return True
+        except Exception:
+            bot_logger.exception("Error saving server configs")
+            return False
+    
+    def mark_dirty(self, guild_id: int):
+        """Record an unsaved change for a guild and schedule a debounced save"""
+        self._dirty_guilds.add(guild_id)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+    
+    async def _delayed_flush(self):
+        """Let rapid changes settle, then persist them with a single write"""
+        await asyncio.sleep(_SAVE_DELAY)
+        # Detach first so changes made while writing schedule their own flush
+        self._flush_task = None
+        await self.flush()
+    
+    async def flush(self):
+        """Persist pending changes immediately if there are any"""
+        if not self._dirty_guilds:
+            return
+        # Take the current set so changes made during the write are tracked for the next flush
+        dirty, self._dirty_guilds = self._dirty_guilds, set()
+        if not await self.save_configs():
+            # Keep the failed guilds pending so the next flush retries them
+            self._dirty_guilds |= dirty
     
-    def get_server_config(self, guild_id: int) -> Dict[str, Any]:
+    def get_server_config(self, guild_id: int) -> ServerConfig:
         """Get or create server configuration"""
         guild_id_str = str(guild_id)
-        if guild_id_str not in self.server_configs:
-            self.server_configs[guild_id_str] = {
-                "rank_channel": None,
-                "suggestions_channel": None,
-                "welcome_channel": None,
-                "temp_voice_category": None,
-                "features": {
-                    "ranking_system": True,      # Core feature - always enabled
-                    "suggestions_system": False, # Optional
-                    "welcome_messages": False,   # Optional
-                    "temp_voice": False,         # Optional
-                    "reaction_roles": False      # Optional
-                },
-                "welcome_config": {
-                    "custom_message": None,      # Custom welcome message template
-                    "use_embed": True,          # Use embed vs plain message
-                    "embed_color": "00ff00",    # Hex color for embed
-                    "ping_user": True,          # Whether to ping the new user
-                    "show_server_info": True    # Show server member count etc
-                },
-                "setup_completed": False,
-                "setup_date": None
-            }
-        return self.server_configs[guild_id_str]
+        config = self.server_configs.get(guild_id_str)
+        if config is None:
+            config = _new_config()
+            self.server_configs[guild_id_str] = config
+        return config
+    
+    def peek_server_config(self, guild_id: int) -> Mapping[str, Any]:
+        """Read-only config lookup that never creates an entry for unknown servers"""
+        return self.server_configs.get(str(guild_id), _EMPTY_CONFIG)
     
     def get_rank_channel_id(self, guild_id: int) -> Optional[int]:
         """Get the configured rank channel ID for a server"""
-        config = self.get_server_config(guild_id)
-        return config.get("rank_channel")
+        return self.peek_server_config(guild_id).get("rank_channel")
     
     def get_suggestions_channel_id(self, guild_id: int) -> Optional[int]:
         """Get the configured suggestions channel ID for a server"""
-        config = self.get_server_config(guild_id)
-        return config.get("suggestions_channel")
+        return self.peek_server_config(guild_id).get("suggestions_channel")
     
     def get_welcome_channel_id(self, guild_id: int) -> Optional[int]:
         """Get the configured welcome channel ID for a server"""
-        config = self.get_server_config(guild_id)
-        return config.get("welcome_channel")
+        return self.peek_server_config(guild_id).get("welcome_channel")
     
     def get_temp_voice_category_id(self, guild_id: int) -> Optional[int]:
         """Get the configured temp voice category ID for a server"""
-        config = self.get_server_config(guild_id)
-        return config.get("temp_voice_category")
+        return self.peek_server_config(guild_id).get("temp_voice_category")
     
     def is_feature_enabled(self, guild_id: int, feature: str) -> bool:
         """Check if a specific feature is enabled for a server"""
-        config = self.get_server_config(guild_id)
-        return config.get("features", {}).get(feature, False)
+        return self.peek_server_config(guild_id).get("features", {}).get(feature, False)
     
-    def get_welcome_config(self, guild_id: int) -> dict:
+    def get_welcome_config(self, guild_id: int) -> WelcomeConfig:
         """Get welcome message configuration for a server"""
-        config = self.get_server_config(guild_id)
-        return config.get("welcome_config", {
-            "custom_message": None,
-            "use_embed": True,
-            "embed_color": "00ff00", 
-            "ping_user": True,
-            "show_server_info": True
-        })
+        return self.peek_server_config(guild_id).get("welcome_config", _DEFAULT_WELCOME)
     
     @app_commands.command(name='setup', description='Configure the bot for your server')
     @app_commands.default_permissions(administrator=True)
@@ -126,24 +472,8 @@ class SetupSystem(commands.Cog):
         
         config = self.get_server_config(guild.id)
         
-        # Create setup embed
-        embed = discord.Embed(
-            title="🛹 7-Ply Bot Setup",
-            description="Let's configure the bot for your server!",
-            color=0x00ff88
-        )
-        
-        embed.add_field(
-            name="🎯 Available Features:",
-            value="🏆 **Ranking System** - User progression and points (Always included)\n💡 **Suggestions System** - Community feedback with voting\n👋 **Welcome Messages** - Greet new members\n🔊 **Temp Voice Channels** - User-managed voice rooms\n🎭 **Reaction Roles** - Self-serve skateboard-themed roles",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔧 Requirements:",
-            value="• You need **Administrator** permissions\n• Bot needs permission to create/manage channels\n• Bot needs permission to send messages and embeds",
-            inline=False
-        )
+        # Create setup embed from the static template
+        embed = self.embed_from_template(_SETUP_BASE_EMBED)
         
         # Check if already setup
         if config.get("setup_completed"):
@@ -154,12 +484,8 @@ class SetupSystem(commands.Cog):
             )
             embed.color = 0xffd700
         
-        embed.set_footer(text="Click the button below to start setup!")
-        
-        # Create setup button
-        view = SetupView(self, guild)
-        
-        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        # Fresh view per /setup message - ephemeral messages can't carry persistent views
+        await interaction.response.send_message(embed=embed, view=SetupView(self), ephemeral=True)
     
     @app_commands.command(name='setup_reset', description='Reset bot configuration for this server')
     @app_commands.default_permissions(administrator=True)
@@ -179,7 +505,7 @@ class SetupSystem(commands.Cog):
         guild_id_str = str(guild.id)
         if guild_id_str in self.server_configs:
             del self.server_configs[guild_id_str]
-            self.save_configs()
+            self.mark_dirty(guild.id)
         
         description = "Server configuration has been reset. Use `/setup` to configure again."
         if was_stuck:
@@ -215,29 +541,28 @@ class SetupSystem(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
-        # Create edit selection embed
-        embed = discord.Embed(
-            title="🔧 Edit Bot Settings",
-            description="Choose what you'd like to modify:",
-            color=0x00ff88
-        )
+        # Create edit selection embed from the static template
+        embed = self.embed_from_template(_SETUP_EDIT_EMBED)
         
         # Show current configuration status
-        ranking_channel = f"<#{config.get('ranking_channel_id')}>" if config.get('ranking_channel_id') else "Not set"
-        welcome_status = "✅ Enabled" if config.get('features', {}).get('welcome_messages') else "❌ Disabled"
-        suggestions_status = "✅ Enabled" if config.get('features', {}).get('suggestions') else "❌ Disabled"
-        temp_voice_status = "✅ Enabled" if config.get('features', {}).get('temp_voice') else "❌ Disabled"
-        reaction_roles_status = "✅ Enabled" if config.get('features', {}).get('reaction_roles') else "❌ Disabled"
-        
-        embed.add_field(
+        ranking_channel_id = config.get('ranking_channel_id')
+        ranking_channel = f"<#{ranking_channel_id}>" if ranking_channel_id else "Not set"
+        features = config.get('features') or {}
+        welcome_status = _STATUS_LABEL[bool(features.get('welcome_messages'))]
+        suggestions_status = _STATUS_LABEL[bool(features.get('suggestions'))]
+        temp_voice_status = _STATUS_LABEL[bool(features.get('temp_voice'))]
+        reaction_roles_status = _STATUS_LABEL[bool(features.get('reaction_roles'))]
+        
+        embed.insert_field_at(
+            0,
             name="📊 Current Settings:",
-            value=f"🏆 **Ranking Channel**: {ranking_channel}\n💡 **Suggestions**: {suggestions_status}\n👋 **Welcome Messages**: {welcome_status}\n🔊 **Temp Voice**: {temp_voice_status}\n🎭 **Reaction Roles**: {reaction_roles_status}",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💡 What can you edit?",
-            value="• Change channel assignments\n• Enable/disable features\n• Modify welcome message settings\n• Update any configuration without losing other settings",
+            value=_EDIT_STATUS_TEMPLATE.format(
+                ranking_channel=ranking_channel,
+                suggestions=suggestions_status,
+                welcome=welcome_status,
+                temp_voice=temp_voice_status,
+                reaction_roles=reaction_roles_status
+            ),
             inline=False
         )
         
@@ -256,42 +581,30 @@ class SetupSystem(commands.Cog):
             await interaction.response.send_message("❌ This command can only be used in a server!", ephemeral=True)
             return
         
+        config = self.get_server_config(guild.id)
+        
         # Check if welcome messages are enabled
-        if not self.is_feature_enabled(guild.id, "welcome_messages"):
+        if not config.get("features", {}).get("welcome_messages"):
             await interaction.response.send_message("❌ Welcome messages are not enabled! Run `/setup` and enable the welcome feature first.", ephemeral=True)
             return
         
         # Show current configuration and customization options
-        welcome_config = self.get_welcome_config(guild.id)
+        welcome_config = config.get("welcome_config", _DEFAULT_WELCOME)
         
-        embed = discord.Embed(
-            title="👋 Welcome Message Configuration",
-            description="Customize how 7-Ply greets new members!",
-            color=0x00ff88
-        )
+        embed = self.embed_from_template(_WELCOME_CONFIG_EMBED)
         
         current_message = welcome_config.get("custom_message") or "**Default skateboard-themed welcome**"
-        embed.add_field(
+        embed.insert_field_at(
+            0,
             name="📝 Current Message Template:",
             value=f"```{current_message}```",
             inline=False
         )
         
-        embed.add_field(
-            name="🎨 Available Variables:",
-            value="`{user}` - Mentions the new user\n`{user_name}` - User's display name\n`{server}` - Server name\n`{member_count}` - Current member count\n`{date}` - Current date",
-            inline=False
-        )
-        
-        embed.add_field(
+        embed.insert_field_at(
+            2,
             name="⚙️ Current Settings:",
-            value=f"📋 Use Embed: {'✅' if welcome_config.get('use_embed', True) else '❌'}\n🎨 Embed Color: #{welcome_config.get('embed_color', '00ff00')}\n🔔 Ping User: {'✅' if welcome_config.get('ping_user', True) else '❌'}\n📊 Show Server Info: {'✅' if welcome_config.get('show_server_info', True) else '❌'}",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🛠️ How to Customize:",
-            value="Use `/welcome_set_message` to change the message template\nUse `/welcome_settings` to adjust display options",
+            value=f"📋 Use Embed: {_CHECK[bool(welcome_config.get('use_embed', True))]}\n🎨 Embed Color: #{welcome_config.get('embed_color', '00ff00')}\n🔔 Ping User: {_CHECK[bool(welcome_config.get('ping_user', True))]}\n📊 Show Server Info: {_CHECK[bool(welcome_config.get('show_server_info', True))]}",
             inline=False
         )
         
@@ -317,21 +630,45 @@ class SetupSystem(commands.Cog):
             await interaction.response.send_message("❌ Welcome message must be 1000 characters or less!", ephemeral=True)
             return
         
+        # Validate placeholders against the allowlist with the same parser str.format uses
+        try:
+            fields = [
+                (field_name, conversion, format_spec)
+                for _, field_name, format_spec, conversion in string.Formatter().parse(message)
+                if field_name is not None
+            ]
+        except ValueError:
+            await interaction.response.send_message("❌ Welcome message has unmatched `{` or `}` - use `{{` and `}}` for literal braces.", ephemeral=True)
+            return
+        bad_placeholders = [field_name for field_name, _, _ in fields if field_name not in _ALLOWED_PLACEHOLDERS]
+        if bad_placeholders:
+            await interaction.response.send_message(
+                f"❌ Unknown placeholder(s): {', '.join(f'`{{{field}}}`' for field in bad_placeholders)}\n"
+                f"Allowed: `{{user}}`, `{{user_name}}`, `{{server}}`, `{{member_count}}`, `{{date}}`",
+                ephemeral=True
+            )
+            return
+        if any(conversion or format_spec for _, conversion, format_spec in fields):
+            await interaction.response.send_message("❌ Placeholders can't use conversions or format specs - write them as plain `{user}`, `{server}` etc.", ephemeral=True)
+            return
+        
+        # Render the preview before saving so a template that can't be formatted is never stored
+        try:
+            preview_message = message.format(
+                user=interaction.user.mention,
+                user_name=interaction.user.display_name,
+                server=guild.name,
+                member_count=guild.member_count,
+                date="Today"
+            )
+        except (ValueError, KeyError, IndexError, AttributeError):
+            await interaction.response.send_message("❌ Welcome message could not be rendered - check your placeholders and braces.", ephemeral=True)
+            return
+        
         # Save custom message
         config = self.get_server_config(guild.id)
-        if "welcome_config" not in config:
-            config["welcome_config"] = {}
-        config["welcome_config"]["custom_message"] = message
-        self.save_configs()
-        
-        # Preview the message
-        preview_message = message.format(
-            user=interaction.user.mention,
-            user_name=interaction.user.display_name,
-            server=guild.name,
-            member_count=guild.member_count,
-            date="Today"
-        )
+        config.setdefault("welcome_config", {})["custom_message"] = message
+        self.mark_dirty(guild.id)
         
         embed = discord.Embed(
             title="✅ Welcome Message Updated!",
@@ -363,29 +700,17 @@ class SetupSystem(commands.Cog):
             await interaction.response.send_message("❌ This command can only be used in a server!", ephemeral=True)
             return
         
-        if not self.is_feature_enabled(guild.id, "welcome_messages"):
+        config = self.get_server_config(guild.id)
+        if not config.get("features", {}).get("welcome_messages"):
             await interaction.response.send_message("❌ Welcome messages are not enabled! Run `/setup` first.", ephemeral=True)
             return
         
         # Create interactive view for settings
         view = WelcomeSettingsView(self, guild.id)
         
-        embed = discord.Embed(
-            title="⚙️ Welcome Message Settings",
-            description="Click the buttons below to toggle settings:",
-            color=0x00ff88
-        )
-        
-        welcome_config = self.get_welcome_config(guild.id)
-        settings_text = f"📋 Use Embed: {'✅' if welcome_config.get('use_embed', True) else '❌'}\n"
-        settings_text += f"🔔 Ping User: {'✅' if welcome_config.get('ping_user', True) else '❌'}\n" 
-        settings_text += f"📊 Show Server Info: {'✅' if welcome_config.get('show_server_info', True) else '❌'}\n"
-        settings_text += f"🎨 Embed Color: #{welcome_config.get('embed_color', '00ff00')}"
-        
-        embed.add_field(
-            name="Current Settings:",
-            value=settings_text,
-            inline=False
+        embed = self.build_welcome_settings_embed(
+            config.get("welcome_config", _DEFAULT_WELCOME),
+            "Click the buttons below to toggle settings:"
         )
         
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
@@ -449,108 +774,59 @@ class SetupSystem(commands.Cog):
                 inline=True
             )
         
-        # Features status
-        features_status = "✅ Ranking System\n✅ Skateboard Commands\n✅ Trick Database\n✅ User Progression"
-        embed.add_field(
-            name="🛹 Available Features",
-            value=features_status,
-            inline=False
-        )
+        # Features status (static)
+        embed.add_field(**_STATUS_FEATURES_FIELD)
         
         await interaction.response.send_message(embed=embed)
 
 class FeatureSelectView(discord.ui.View):
-    """Feature selection view for setup"""
+    """Feature selection view for setup
     
-    def __init__(self, setup_cog: SetupSystem, guild: discord.Guild):
+    One view per /setup message - the session's selection lives on the cog
+    in _pending_setups, keyed by the setup message ID.
+    """
+    
+    def __init__(self, setup_cog: SetupSystem):
         super().__init__(timeout=300)  # 5 minute timeout
         self.setup_cog = setup_cog
-        self.guild = guild
-        self.selected_features = {"ranking_system": True}  # Always enabled
-        self.add_feature_selectors()
-    
-    def add_feature_selectors(self):
-        """Add feature selection buttons"""
-        # Suggestions System
-        suggestions_button = discord.ui.Button(
-            label="� Suggestions System",
-            style=discord.ButtonStyle.secondary,
-            custom_id="toggle_suggestions"
-        )
-        suggestions_button.callback = self.toggle_suggestions
-        self.add_item(suggestions_button)
-        
-        # Welcome Messages  
-        welcome_button = discord.ui.Button(
-            label="👋 Welcome Messages", 
-            style=discord.ButtonStyle.secondary,
-            custom_id="toggle_welcome"
-        )
-        welcome_button.callback = self.toggle_welcome
-        self.add_item(welcome_button)
-        
-        # Temp Voice
-        voice_button = discord.ui.Button(
-            label="🔊 Temp Voice Channels",
-            style=discord.ButtonStyle.secondary, 
-            custom_id="toggle_voice"
-        )
-        voice_button.callback = self.toggle_voice
-        self.add_item(voice_button)
-        
-        # Reaction Roles
-        reaction_roles_button = discord.ui.Button(
-            label="🎭 Reaction Roles",
-            style=discord.ButtonStyle.secondary,
-            custom_id="toggle_reaction_roles"
-        )
-        reaction_roles_button.callback = self.toggle_reaction_roles
-        self.add_item(reaction_roles_button)
-        
-        # Proceed button
-        proceed_button = discord.ui.Button(
-            label="🚀 Proceed with Setup",
-            style=discord.ButtonStyle.green,
-            custom_id="proceed_setup"
-        )
-        proceed_button.callback = self.proceed_setup
-        self.add_item(proceed_button)
     
-    async def toggle_suggestions(self, interaction: discord.Interaction):
+    async def get_selected_features(self, interaction: discord.Interaction) -> Optional[Dict[str, bool]]:
+        """Get the feature selection for the clicked setup message, telling the user if the session expired"""
+        selected_features = self.setup_cog.get_pending_setup(interaction.message.id)
+        if selected_features is None:
+            await interaction.response.send_message("❌ This setup session has expired - run `/setup` again to start over.", ephemeral=True)
+        return selected_features
+    
+    @discord.ui.button(label="💡 Suggestions System", style=discord.ButtonStyle.secondary, custom_id="toggle_suggestions")
+    async def toggle_suggestions(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle suggestions system"""
-        if not await self.check_permissions(interaction):
-            return
-        
-        current = self.selected_features.get("suggestions_system", False)
-        self.selected_features["suggestions_system"] = not current
-        await self.update_display(interaction)
+        await self.toggle_feature(interaction, "suggestions_system")
     
-    async def toggle_welcome(self, interaction: discord.Interaction):
+    @discord.ui.button(label="👋 Welcome Messages", style=discord.ButtonStyle.secondary, custom_id="toggle_welcome")
+    async def toggle_welcome(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle welcome messages"""
-        if not await self.check_permissions(interaction):
-            return
-        
-        current = self.selected_features.get("welcome_messages", False)
-        self.selected_features["welcome_messages"] = not current
-        await self.update_display(interaction)
+        await self.toggle_feature(interaction, "welcome_messages")
     
-    async def toggle_voice(self, interaction: discord.Interaction):
+    @discord.ui.button(label="🔊 Temp Voice Channels", style=discord.ButtonStyle.secondary, custom_id="toggle_voice")
+    async def toggle_voice(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle temp voice channels"""
-        if not await self.check_permissions(interaction):
-            return
-        
-        current = self.selected_features.get("temp_voice", False)
-        self.selected_features["temp_voice"] = not current
-        await self.update_display(interaction)
+        await self.toggle_feature(interaction, "temp_voice")
     
-    async def toggle_reaction_roles(self, interaction: discord.Interaction):
+    @discord.ui.button(label="🎭 Reaction Roles", style=discord.ButtonStyle.secondary, custom_id="toggle_reaction_roles")
+    async def toggle_reaction_roles(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle reaction roles"""
+        await self.toggle_feature(interaction, "reaction_roles")
+    
+    async def toggle_feature(self, interaction: discord.Interaction, feature: str):
+        """Flip one feature in this guild's pending selection and redraw"""
         if not await self.check_permissions(interaction):
             return
         
-        current = self.selected_features.get("reaction_roles", False)
-        self.selected_features["reaction_roles"] = not current
-        await self.update_display(interaction)
+        selected_features = await self.get_selected_features(interaction)
+        if selected_features is None:
+            return
+        selected_features[feature] = not selected_features.get(feature, False)
+        await self.update_display(interaction, selected_features)
     
     async def check_permissions(self, interaction: discord.Interaction) -> bool:
         """Check if user has permissions"""
@@ -559,69 +835,52 @@ class FeatureSelectView(discord.ui.View):
             return False
         return True
     
-    async def update_display(self, interaction: discord.Interaction):
+    async def update_display(self, interaction: discord.Interaction, selected_features: Dict[str, bool]):
         """Update the display with current selections"""
-        embed = discord.Embed(
-            title="🛹 7-Ply Bot Setup - Feature Selection",
-            description="Choose which features you want to enable:",
-            color=0x00ff88
-        )
+        embed = self.setup_cog.embed_from_template(_FEATURE_SELECTION_EMBED)
         
         # Show current selections
-        feature_status = "🏆 **Ranking System** ✅ (Always enabled)\n"
-        
-        if self.selected_features.get("suggestions_system"):
-            feature_status += "💡 **Suggestions System** ✅\n"
-        else:
-            feature_status += "💡 **Suggestions System** ❌\n"
-            
-        if self.selected_features.get("welcome_messages"):
-            feature_status += "👋 **Welcome Messages** ✅\n"
-        else:
-            feature_status += "👋 **Welcome Messages** ❌\n"
-            
-        if self.selected_features.get("temp_voice"):
-            feature_status += "🔊 **Temp Voice Channels** ✅\n"
-        else:
-            feature_status += "🔊 **Temp Voice Channels** ❌\n"
-            
-        if self.selected_features.get("reaction_roles"):
-            feature_status += "🎭 **Reaction Roles** ✅"
-        else:
-            feature_status += "🎭 **Reaction Roles** ❌"
+        lines = [f"{emoji} **{label}** {_CHECK[bool(selected_features.get(key))]}" for key, label, emoji in _FEATURE_ROWS]
+        feature_status = "🏆 **Ranking System** ✅ (Always enabled)\n" + "\n".join(lines)
         
-        embed.add_field(
+        embed.insert_field_at(
+            0,
             name="📋 Selected Features:",
             value=feature_status,
             inline=False
         )
         
-        embed.add_field(
-            name="💡 Feature Descriptions:",
-            value="• **Suggestions** - Community feedback system with voting\n• **Welcome** - Greet new members with skateboard flair\n• **Temp Voice** - Auto-managed voice channels for sessions",
-            inline=False
-        )
-        
         await interaction.response.edit_message(embed=embed, view=self)
     
-    async def proceed_setup(self, interaction: discord.Interaction):
+    @discord.ui.button(label="🚀 Proceed with Setup", style=discord.ButtonStyle.green, custom_id="proceed_setup")
+    async def proceed_setup(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Proceed with setup using selected features"""
         if not await self.check_permissions(interaction):
             return
+        
+        guild = interaction.guild
+        if not guild:
+            return
             
         # Check bot permissions
-        bot_member = self.guild.get_member(self.setup_cog.bot.user.id)
+        bot_member = guild.me
         if not bot_member or not bot_member.guild_permissions.manage_channels:
             await interaction.response.send_message("❌ I need 'Manage Channels' permission to complete setup!", ephemeral=True)
             return
         
-        await self.run_setup(interaction)
+        selected_features = await self.get_selected_features(interaction)
+        if selected_features is None:
+            return
+        # The session ends here - the setup message loses its buttons either way
+        self.setup_cog._pending_setups.pop(interaction.message.id, None)
+        
+        await self.run_setup(interaction, guild, selected_features)
     
-    async def run_setup(self, interaction: discord.Interaction):
+    async def run_setup(self, interaction: discord.Interaction, guild: discord.Guild, selected_features: Dict[str, bool]):
         """Run the actual setup process with selected features"""
         
         # Check if setup is already in progress
-        config = self.setup_cog.get_server_config(self.guild.id)
+        config = self.setup_cog.get_server_config(guild.id)
         if config.get("setup_in_progress", False):
             await interaction.response.edit_message(
                 embed=discord.Embed(
@@ -635,7 +894,7 @@ class FeatureSelectView(discord.ui.View):
         
         # Mark setup as in progress
         config["setup_in_progress"] = True
-        self.setup_cog.save_configs()
+        self.setup_cog.mark_dirty(guild.id)
         
         setup_embed = discord.Embed(
             title="🔧 Running Setup...",
@@ -643,107 +902,100 @@ class FeatureSelectView(discord.ui.View):
             color=0xffd700
         )
         
-        await interaction.response.edit_message(embed=setup_embed, view=None)
-        
         try:
-            config = self.setup_cog.get_server_config(self.guild.id)
-            created_channels = []
+            await interaction.response.edit_message(embed=setup_embed, view=None)
+            
+            config = self.setup_cog.get_server_config(guild.id)
+            wizard = SetupWizard(self.setup_cog, guild)
             
             # Step 1: Always set up ranking system
-            rank_channel = await self.setup_rank_channel()
-            created_channels.append(f"🏆 {rank_channel.mention} - Ranking announcements")
+            steps = [(wizard.setup_rank_channel(), "🏆 {0.mention} - Ranking announcements")]
             
             # Step 2: Set up optional features
-            if self.selected_features.get("suggestions_system"):
-                suggestions_channel = await self.setup_suggestions_channel()
-                created_channels.append(f"💡 {suggestions_channel.mention} - Community suggestions")
-                
-            if self.selected_features.get("welcome_messages"):
-                welcome_channel = await self.setup_welcome_channel()
-                created_channels.append(f"👋 {welcome_channel.mention} - Welcome messages")
-                
-            if self.selected_features.get("temp_voice"):
-                voice_category = await self.setup_temp_voice()
-                created_channels.append(f"🔊 {voice_category.name} - Temp voice category")
+            if selected_features.get("suggestions_system"):
+                steps.append((wizard.setup_suggestions_channel(), "💡 {0.mention} - Community suggestions"))
+            if selected_features.get("welcome_messages"):
+                steps.append((wizard.setup_welcome_channel(), "👋 {0.mention} - Welcome messages"))
+            if selected_features.get("temp_voice"):
+                steps.append((wizard.setup_temp_voice(), "🔊 {0.name} - Temp voice category"))
             
-            # Step 3: Save configuration
-            config["features"] = self.selected_features.copy()
+            # Each step writes its own config key, so run them concurrently - channel creations still
+            # share one per-guild rate limit bucket, so only the lookups and other calls overlap.
+            # Let every step finish before reporting a failure so none is still creating channels
+            # or writing config after setup_in_progress is cleared
+            results = await asyncio.gather(*(step for step, _ in steps), return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            created_channels = [line.format(result) for (_, line), result in zip(steps, results)]
+            
+            # Step 3: Save configuration - re-fetch it, as /setup_reset may have replaced it while the steps ran
+            config = self.setup_cog.get_server_config(guild.id)
+            config["features"] = selected_features.copy()
             config["setup_completed"] = True
             config["setup_date"] = self.setup_cog.get_edt_now().strftime("%Y-%m-%d")
             # Remove setup in progress flag
             config.pop("setup_in_progress", None)
-            self.setup_cog.save_configs()
+            self.setup_cog.mark_dirty(guild.id)
+            # Persist the finished setup now rather than waiting out the debounce
+            await self.setup_cog.flush()
             
             # Step 4: Send success message
-            success_embed = discord.Embed(
-                title="✅ Setup Complete!",
-                description="Your server is now configured for 7-Ply Bot!",
-                color=0x00ff00
-            )
-            
-            success_embed.add_field(
+            success_embed = self.setup_cog.embed_from_template(_SETUP_SUCCESS_EMBED)
+            success_embed.insert_field_at(
+                0,
                 name="📊 Configured Channels/Features:",
                 value="\n".join(created_channels),
                 inline=False
             )
             
-            success_embed.add_field(
-                name="🎯 Next Steps:",
-                value="• Members can start earning points by chatting\n• Use `/rank` to check progress\n• Use `/help` to see all available commands\n• Try `/trick` or `/skatefact` for skateboard content!",
-                inline=False
-            )
-            
-            success_embed.set_footer(text="Setup completed successfully! 🛹")
-            
             await interaction.edit_original_response(embed=success_embed)
             
         except Exception as e:
-            # Clean up setup in progress flag on error
-            config = self.setup_cog.get_server_config(self.guild.id)
-            config.pop("setup_in_progress", None)
-            self.setup_cog.save_configs()
-            
             error_embed = discord.Embed(
                 title="❌ Setup Failed",
                 description=f"**Error:** {str(e)}\n\n**Common fixes:**\n• Make sure I have Administrator permissions\n• Try running `/setup` again\n• Contact support if this persists",
                 color=0xff0000
             )
             await interaction.edit_original_response(embed=error_embed)
-            print(f"Setup error: {e}")
+            bot_logger.exception(f"Setup error for guild {guild.id}")
+        finally:
+            # Clean up setup in progress flag on any failure - including a cancelled step, which
+            # re-raises a CancelledError that except Exception doesn't catch
+            config = self.setup_cog.get_server_config(guild.id)
+            if config.pop("setup_in_progress", None) is not None:
+                self.setup_cog.mark_dirty(guild.id)
+
+class SetupWizard:
+    """Discovers or creates the channels used by the selected features of one guild"""
+    
+    def __init__(self, setup_cog: SetupSystem, guild: discord.Guild):
+        self.setup_cog = setup_cog
+        self.guild = guild
     
     async def setup_rank_channel(self) -> discord.TextChannel:
         """Set up the ranking channel"""
         # Look for existing rank channel
-        for channel in self.guild.text_channels:
-            if channel.name.lower() in ['rank', 'ranks', 'ranking']:
-                rank_channel = channel
-                break
+        rank_channel = next(
+            (c for c in self.guild.text_channels if c.name.lower() in _RANK_CHANNEL_NAMES), None
+        )
+        # Apply permissions in the same request that creates or edits the channel
+        overwrites = _rank_channel_overwrites(self.guild)
+        if rank_channel:
+            # Keep any overwrites the server already has on this channel; skip the request on re-runs
+            current = rank_channel.overwrites
+            merged = {**current, **overwrites}
+            if merged != current:
+                await rank_channel.edit(overwrites=merged)
         else:
             # Create new rank channel
             rank_channel = await self.guild.create_text_channel(
                 name='rank-ups',
                 topic='🛹 User rankings and progression - powered by 7-Ply Bot',
+                overwrites=overwrites,
                 reason='7-Ply Bot setup - ranking channel'
             )
         
-        # Set up permissions
-        await rank_channel.set_permissions(
-            self.guild.default_role,
-            send_messages=False,
-            add_reactions=True,
-            read_messages=True
-        )
-        
-        bot_member = self.guild.get_member(self.setup_cog.bot.user.id)
-        if bot_member:
-            await rank_channel.set_permissions(
-                bot_member,
-                send_messages=True,
-                embed_links=True,
-                attach_files=True,
-                read_messages=True
-            )
-        
         # Save channel ID
         config = self.setup_cog.get_server_config(self.guild.id)
         config["rank_channel"] = rank_channel.id
@@ -753,11 +1005,10 @@ class FeatureSelectView(discord.ui.View):
     async def setup_suggestions_channel(self) -> discord.TextChannel:
         """Set up the suggestions channel"""
         # Look for existing suggestions channel
-        for channel in self.guild.text_channels:
-            if 'suggest' in channel.name.lower():
-                suggestions_channel = channel
-                break
-        else:
+        suggestions_channel = next(
+            (c for c in self.guild.text_channels if 'suggest' in c.name.lower()), None
+        )
+        if not suggestions_channel:
             # Create new suggestions channel
             suggestions_channel = await self.guild.create_text_channel(
                 name='suggestions',
@@ -773,17 +1024,11 @@ class FeatureSelectView(discord.ui.View):
     
     async def setup_welcome_channel(self) -> discord.TextChannel:
         """Set up welcome channel - uses general or creates one"""
-        # Look for general/welcome channel
-        welcome_channel = None
-        for channel in self.guild.text_channels:
-            if channel.name.lower() in ['general', 'welcome', 'lobby', 'main']:
-                welcome_channel = channel
-                break
+        # Look for general/welcome channel, then fall back to the system channel
+        welcome_channel = next(
+            (c for c in self.guild.text_channels if c.name.lower() in _WELCOME_CHANNEL_NAMES), None
+        ) or self.guild.system_channel
         
-        if not welcome_channel:
-            # Use system channel if available
-            welcome_channel = self.guild.system_channel
-            
         if not welcome_channel:
             # Create welcome channel as last resort
             welcome_channel = await self.guild.create_text_channel(
@@ -803,7 +1048,8 @@ class FeatureSelectView(discord.ui.View):
         # Look for existing voice category
         voice_category = None
         for category in self.guild.categories:
-            if 'voice' in category.name.lower() or 'temp' in category.name.lower():
+            name = category.name.lower()
+            if any(keyword in name for keyword in _TEMP_VOICE_KEYWORDS):
                 voice_category = category
                 break
         
@@ -832,59 +1078,40 @@ class WelcomeSettingsView(discord.ui.View):
     async def toggle_embed(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle embed usage"""
         config = self.setup_cog.get_server_config(self.guild_id)
-        current = config.get("welcome_config", {}).get("use_embed", True)
+        welcome_config = config.setdefault("welcome_config", {})
+        current = welcome_config.get("use_embed", True)
+        welcome_config["use_embed"] = not current
+        self.setup_cog.mark_dirty(self.guild_id)
         
-        if "welcome_config" not in config:
-            config["welcome_config"] = {}
-        config["welcome_config"]["use_embed"] = not current
-        self.setup_cog.save_configs()
-        
-        await self.update_display(interaction, f"📋 Embed usage: {'Enabled' if not current else 'Disabled'}")
+        await self.update_display(interaction, f"📋 Embed usage: {'Enabled' if not current else 'Disabled'}", welcome_config)
     
     @discord.ui.button(label='🔔 Toggle Ping', style=discord.ButtonStyle.secondary)
     async def toggle_ping(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle user pinging"""
         config = self.setup_cog.get_server_config(self.guild_id)
-        current = config.get("welcome_config", {}).get("ping_user", True)
-        
-        if "welcome_config" not in config:
-            config["welcome_config"] = {}
-        config["welcome_config"]["ping_user"] = not current
-        self.setup_cog.save_configs()
+        welcome_config = config.setdefault("welcome_config", {})
+        current = welcome_config.get("ping_user", True)
+        welcome_config["ping_user"] = not current
+        self.setup_cog.mark_dirty(self.guild_id)
         
-        await self.update_display(interaction, f"🔔 User ping: {'Enabled' if not current else 'Disabled'}")
+        await self.update_display(interaction, f"🔔 User ping: {'Enabled' if not current else 'Disabled'}", welcome_config)
     
     @discord.ui.button(label='📊 Toggle Server Info', style=discord.ButtonStyle.secondary)
     async def toggle_server_info(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Toggle server info display"""
         config = self.setup_cog.get_server_config(self.guild_id)
-        current = config.get("welcome_config", {}).get("show_server_info", True)
-        
-        if "welcome_config" not in config:
-            config["welcome_config"] = {}
-        config["welcome_config"]["show_server_info"] = not current
-        self.setup_cog.save_configs()
+        welcome_config = config.setdefault("welcome_config", {})
+        current = welcome_config.get("show_server_info", True)
+        welcome_config["show_server_info"] = not current
+        self.setup_cog.mark_dirty(self.guild_id)
         
-        await self.update_display(interaction, f"📊 Server info: {'Enabled' if not current else 'Disabled'}")
+        await self.update_display(interaction, f"📊 Server info: {'Enabled' if not current else 'Disabled'}", welcome_config)
     
-    async def update_display(self, interaction: discord.Interaction, change_message: str):
-        """Update the settings display"""
-        embed = discord.Embed(
-            title="⚙️ Welcome Message Settings",
-            description=f"✅ {change_message}\n\nClick buttons below to toggle more settings:",
-            color=0x00ff88
-        )
-        
-        welcome_config = self.setup_cog.get_welcome_config(self.guild_id)
-        settings_text = f"📋 Use Embed: {'✅' if welcome_config.get('use_embed', True) else '❌'}\n"
-        settings_text += f"🔔 Ping User: {'✅' if welcome_config.get('ping_user', True) else '❌'}\n"
-        settings_text += f"📊 Show Server Info: {'✅' if welcome_config.get('show_server_info', True) else '❌'}\n"
-        settings_text += f"🎨 Embed Color: #{welcome_config.get('embed_color', '00ff00')}"
-        
-        embed.add_field(
-            name="Current Settings:",
-            value=settings_text,
-            inline=False
+    async def update_display(self, interaction: discord.Interaction, change_message: str, welcome_config: WelcomeConfig):
+        """Update the settings display from the welcome_config the caller just changed"""
+        embed = self.setup_cog.build_welcome_settings_embed(
+            welcome_config,
+            f"✅ {change_message}\n\nClick buttons below to toggle more settings:"
         )
         
         await interaction.response.edit_message(embed=embed, view=self)
@@ -892,12 +1119,11 @@ class WelcomeSettingsView(discord.ui.View):
 class SetupView(discord.ui.View):
     """Initial setup view - directs to feature selection"""
     
-    def __init__(self, setup_cog: SetupSystem, guild: discord.Guild):
+    def __init__(self, setup_cog: SetupSystem):
         super().__init__(timeout=300)  # 5 minute timeout
         self.setup_cog = setup_cog
-        self.guild = guild
     
-    @discord.ui.button(label='🎯 Select Features', style=discord.ButtonStyle.green)
+    @discord.ui.button(label='🎯 Select Features', style=discord.ButtonStyle.green, custom_id="setup_select_features")
     async def select_features(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Start feature selection"""
         
@@ -906,145 +1132,14 @@ class SetupView(discord.ui.View):
             await interaction.response.send_message("❌ You need Administrator permissions to run setup!", ephemeral=True)
             return
         
-        # Switch to feature selection view
-        feature_view = FeatureSelectView(self.setup_cog, self.guild)
-        
-        embed = discord.Embed(
-            title="🛹 7-Ply Bot Setup - Feature Selection",
-            description="Choose which features you want to enable:",
-            color=0x00ff88
-        )
-        
-        embed.add_field(
-            name="📋 Available Features:",
-            value="🏆 **Ranking System** ✅ (Always enabled)\n💡 **Suggestions System** ❌\n👋 **Welcome Messages** ❌\n🔊 **Temp Voice Channels** ❌",
-            inline=False
-        )
+        # Start a fresh selection for this setup message - edit_message keeps its ID
+        self.setup_cog.start_pending_setup(interaction.message.id)
         
-        embed.add_field(
-            name="💡 Click buttons to toggle features, then proceed!",
-            value="• **Suggestions** - Community feedback system with voting\n• **Welcome** - Greet new members with skateboard flair\n• **Temp Voice** - Auto-managed voice channels for sessions",
-            inline=False
-        )
+        # Switch to the feature selection view
+        feature_view = FeatureSelectView(self.setup_cog)
+        embed = _FEATURE_SELECT_EMBED
         
         await interaction.response.edit_message(embed=embed, view=feature_view)
-    
-    async def run_setup(self, interaction: discord.Interaction):
-        """Run the actual setup process"""
-        
-        setup_embed = discord.Embed(
-            title="🔧 Running Setup...",
-            description="Setting up your server configuration...",
-            color=0xffd700
-        )
-        
-        await interaction.response.edit_message(embed=setup_embed, view=None)
-        
-        try:
-            # Step 1: Find or create rank channel
-            rank_channel = None
-            
-            # Look for existing #rank channel
-            for channel in self.guild.text_channels:
-                if channel.name.lower() in ['rank', 'ranks', 'ranking']:
-                    rank_channel = channel
-                    break
-            
-            # Create rank channel if not found
-            if not rank_channel:
-                rank_channel = await self.guild.create_text_channel(
-                    name='rank',
-                    topic='🛹 User rankings and progression - powered by 7-Ply Bot',
-                    reason='7-Ply Bot setup - ranking channel'
-                )
-            
-            # Step 2: Set up channel permissions
-            await rank_channel.set_permissions(
-                self.guild.default_role,
-                send_messages=False,  # Users can't chat here
-                add_reactions=True,   # But can react to rank posts
-                read_messages=True    # Can view rankings
-            )
-            
-            bot_member = self.guild.get_member(self.setup_cog.bot.user.id)
-            if bot_member:
-                await rank_channel.set_permissions(
-                    bot_member,
-                    send_messages=True,
-                    embed_links=True,
-                    attach_files=True,
-                    read_messages=True
-                )
-            
-            # Step 3: Save configuration
-            config = self.setup_cog.get_server_config(self.guild.id)
-            config["rank_channel"] = rank_channel.id
-            config["setup_completed"] = True
-            config["setup_date"] = self.setup_cog.get_edt_now().strftime("%Y-%m-%d")
-            
-            self.setup_cog.save_configs()
-            
-            # Step 4: Send welcome message to rank channel
-            welcome_embed = discord.Embed(
-                title="🛹 Welcome to 7-Ply Rankings!",
-                description="This channel will display user rankings and progression.",
-                color=0x00ff88
-            )
-            
-            welcome_embed.add_field(
-                name="🎯 Available Commands:",
-                value="• `/rank` - View your rank and progress\n• `/leaderboard` - See top-ranked users\n• `/1up @user` - Give someone bonus points\n• `/trick` - Get random skateboard tricks",
-                inline=False
-            )
-            
-            welcome_embed.add_field(
-                name="💯 How to Earn Points:",
-                value="• Chat messages: 1 point\n• Give reactions: 2 points\n• Receive reactions: 3 points\n• Use commands: 5 points\n• Share media: 20 points\n• Receive 1-ups: 25 points",
-                inline=False
-            )
-            
-            welcome_embed.set_footer(text="Start chatting to begin earning your first rank! 🛹")
-            
-            await rank_channel.send(embed=welcome_embed)
-            
-            # Step 5: Update setup message with success
-            success_embed = discord.Embed(
-                title="✅ Setup Complete!",
-                description="Your server is now fully configured for 7-Ply Bot!",
-                color=0x00ff00
-            )
-            
-            success_embed.add_field(
-                name="📊 Rank Channel",
-                value=f"{rank_channel.mention} - All ranking activity will appear here",
-                inline=False
-            )
-            
-            success_embed.add_field(
-                name="🚀 Next Steps:",
-                value="• Users can start chatting to earn ranks\n• Try `/rank` to see your current status\n• Use `/1up @someone` to give bonus points\n• Explore skateboard commands with `/trick`",
-                inline=False
-            )
-            
-            success_embed.set_footer(text="Your bot is ready to roll! 🛹")
-            
-            await interaction.edit_original_response(embed=success_embed)
-            
-        except Exception as e:
-            error_embed = discord.Embed(
-                title="❌ Setup Failed",
-                description=f"An error occurred during setup: {str(e)}",
-                color=0xff0000
-            )
-            
-            error_embed.add_field(
-                name="🔧 Troubleshooting:",
-                value="• Ensure the bot has 'Manage Channels' permission\n• Make sure you have Administrator permissions\n• Try running `/setup` again",
-                inline=False
-            )
-            
-            await interaction.edit_original_response(embed=error_embed)
-            print(f"Setup error for guild {self.guild.id}: {e}")
 
 class SetupEditView(discord.ui.View):
     """Interactive view for editing specific bot settings"""
@@ -1102,8 +1197,11 @@ class SetupEditView(discord.ui.View):
     async def edit_ranking_channel(self, interaction: discord.Interaction):
         """Edit ranking channel with channel selector"""
         
-        # Get all text channels
-        text_channels = [ch for ch in self.guild.text_channels if ch.permissions_for(self.guild.me).send_messages]
+        # Get the first text channels the bot can post in - the dropdown only shows 25
+        me = self.guild.me
+        text_channels = list(islice(
+            (ch for ch in self.guild.text_channels if ch.permissions_for(me).send_messages), 25
+        ))
         
         if not text_channels:
             await interaction.response.send_message(
@@ -1114,7 +1212,7 @@ class SetupEditView(discord.ui.View):
         
         # Create channel selection dropdown
         channel_options = []
-        for channel in text_channels[:25]:  # Discord limit of 25 options
+        for channel in text_channels:
             current = " (Current)" if self.config.get('ranking_channel_id') == channel.id else ""
             channel_options.append(
                 discord.SelectOption(
@@ -1124,37 +1222,13 @@ class SetupEditView(discord.ui.View):
                 )
             )
         
-        class ChannelSelectView(discord.ui.View):
-            def __init__(self, setup_cog, guild):
-                super().__init__(timeout=60)
-                self.setup_cog = setup_cog
-                self.guild = guild
-            
-            @discord.ui.select(placeholder="🏆 Choose new ranking channel...", options=channel_options)
-            async def channel_select(self, interaction: discord.Interaction, select: discord.ui.Select):
-                new_channel_id = int(select.values[0])
-                new_channel = self.guild.get_channel(new_channel_id)
-                
-                # Update config
-                config = self.setup_cog.get_server_config(self.guild.id)
-                config['ranking_channel_id'] = new_channel_id
-                self.setup_cog.save_configs()
-                
-                embed = discord.Embed(
-                    title="✅ Ranking Channel Updated!",
-                    description=f"Ranking channel changed to {new_channel.mention}",
-                    color=0x00ff88
-                )
-                
-                await interaction.response.edit_message(embed=embed, view=None)
-        
         embed = discord.Embed(
             title="🏆 Change Ranking Channel",
             description="Select a new channel for ranking displays:",
             color=0x00ff88
         )
         
-        channel_view = ChannelSelectView(self.setup_cog, self.guild)
+        channel_view = ChannelSelectView(self.setup_cog, self.guild, channel_options)
         await interaction.response.edit_message(embed=embed, view=channel_view)
     
     async def edit_suggestions_feature(self, interaction: discord.Interaction):
@@ -1162,39 +1236,13 @@ class SetupEditView(discord.ui.View):
         
         current_enabled = self.config.get('features', {}).get('suggestions', False)
         
-        class SuggestionsToggleView(discord.ui.View):
-            def __init__(self, setup_cog, guild):
-                super().__init__(timeout=60)
-                self.setup_cog = setup_cog
-                self.guild = guild
-            
-            @discord.ui.button(label="✅ Enable Suggestions" if not current_enabled else "❌ Disable Suggestions", 
-                             style=discord.ButtonStyle.green if not current_enabled else discord.ButtonStyle.red)
-            async def toggle_suggestions(self, interaction: discord.Interaction, button: discord.ui.Button):
-                config = self.setup_cog.get_server_config(self.guild.id)
-                
-                if not config.get('features'):
-                    config['features'] = {}
-                
-                config['features']['suggestions'] = not current_enabled
-                self.setup_cog.save_configs()
-                
-                status = "enabled" if not current_enabled else "disabled"
-                embed = discord.Embed(
-                    title=f"✅ Suggestions {status.title()}!",
-                    description=f"Suggestions system has been {status}.",
-                    color=0x00ff88 if not current_enabled else 0xff6600
-                )
-                
-                await interaction.response.edit_message(embed=embed, view=None)
-        
         embed = discord.Embed(
             title="💡 Edit Suggestions Feature",
             description=f"Suggestions are currently: **{'Enabled' if current_enabled else 'Disabled'}**",
             color=0x00ff88
         )
         
-        toggle_view = SuggestionsToggleView(self.setup_cog, self.guild)
+        toggle_view = SuggestionsToggleView(self.setup_cog, self.guild, current_enabled)
         await interaction.response.edit_message(embed=embed, view=toggle_view)
     
     async def edit_welcome_feature(self, interaction: discord.Interaction):
@@ -1202,46 +1250,13 @@ class SetupEditView(discord.ui.View):
         
         current_enabled = self.config.get('features', {}).get('welcome_messages', False)
         
-        class WelcomeToggleView(discord.ui.View):
-            def __init__(self, setup_cog, guild):
-                super().__init__(timeout=60)
-                self.setup_cog = setup_cog
-                self.guild = guild
-            
-            @discord.ui.button(label="✅ Enable Welcome Messages" if not current_enabled else "❌ Disable Welcome Messages",
-                             style=discord.ButtonStyle.green if not current_enabled else discord.ButtonStyle.red)
-            async def toggle_welcome(self, interaction: discord.Interaction, button: discord.ui.Button):
-                config = self.setup_cog.get_server_config(self.guild.id)
-                
-                if not config.get('features'):
-                    config['features'] = {}
-                
-                config['features']['welcome_messages'] = not current_enabled
-                self.setup_cog.save_configs()
-                
-                status = "enabled" if not current_enabled else "disabled"
-                embed = discord.Embed(
-                    title=f"✅ Welcome Messages {status.title()}!",
-                    description=f"Welcome messages have been {status}.",
-                    color=0x00ff88 if not current_enabled else 0xff6600
-                )
-                
-                if not current_enabled:
-                    embed.add_field(
-                        name="💡 Next Steps:",
-                        value="Use `/welcome_config` to customize your welcome messages!",
-                        inline=False
-                    )
-                
-                await interaction.response.edit_message(embed=embed, view=None)
-        
         embed = discord.Embed(
             title="👋 Edit Welcome Messages",
             description=f"Welcome messages are currently: **{'Enabled' if current_enabled else 'Disabled'}**",
             color=0x00ff88
         )
         
-        toggle_view = WelcomeToggleView(self.setup_cog, self.guild)
+        toggle_view = WelcomeToggleView(self.setup_cog, self.guild, current_enabled)
         await interaction.response.edit_message(embed=embed, view=toggle_view)
     
     async def edit_temp_voice_feature(self, interaction: discord.Interaction):
@@ -1249,39 +1264,13 @@ class SetupEditView(discord.ui.View):
         
         current_enabled = self.config.get('features', {}).get('temp_voice', False)
         
-        class TempVoiceToggleView(discord.ui.View):
-            def __init__(self, setup_cog, guild):
-                super().__init__(timeout=60)
-                self.setup_cog = setup_cog
-                self.guild = guild
-            
-            @discord.ui.button(label="✅ Enable Temp Voice" if not current_enabled else "❌ Disable Temp Voice",
-                             style=discord.ButtonStyle.green if not current_enabled else discord.ButtonStyle.red)
-            async def toggle_temp_voice(self, interaction: discord.Interaction, button: discord.ui.Button):
-                config = self.setup_cog.get_server_config(self.guild.id)
-                
-                if not config.get('features'):
-                    config['features'] = {}
-                
-                config['features']['temp_voice'] = not current_enabled
-                self.setup_cog.save_configs()
-                
-                status = "enabled" if not current_enabled else "disabled"
-                embed = discord.Embed(
-                    title=f"✅ Temp Voice {status.title()}!",
-                    description=f"Temporary voice channels have been {status}.",
-                    color=0x00ff88 if not current_enabled else 0xff6600
-                )
-                
-                await interaction.response.edit_message(embed=embed, view=None)
-        
         embed = discord.Embed(
             title="🔊 Edit Temp Voice Channels",
             description=f"Temp voice channels are currently: **{'Enabled' if current_enabled else 'Disabled'}**",
             color=0x00ff88
         )
         
-        toggle_view = TempVoiceToggleView(self.setup_cog, self.guild)
+        toggle_view = TempVoiceToggleView(self.setup_cog, self.guild, current_enabled)
         await interaction.response.edit_message(embed=embed, view=toggle_view)
 
     async def edit_reaction_roles_feature(self, interaction: discord.Interaction):
@@ -1289,33 +1278,6 @@ class SetupEditView(discord.ui.View):
         
         current_enabled = self.config.get('features', {}).get('reaction_roles', False)
         
-        class ReactionRolesToggleView(discord.ui.View):
-            def __init__(self, setup_cog, guild):
-                super().__init__(timeout=60)
-                self.setup_cog = setup_cog
-                self.guild = guild
-            
-            @discord.ui.button(label="✅ Enable Reaction Roles" if not current_enabled else "❌ Disable Reaction Roles",
-                             style=discord.ButtonStyle.green if not current_enabled else discord.ButtonStyle.red)
-            async def toggle_reaction_roles(self, interaction: discord.Interaction, button: discord.ui.Button):
-                config = self.setup_cog.get_server_config(self.guild.id)
-                
-                if not config.get('features'):
-                    config['features'] = {}
-                
-                config['features']['reaction_roles'] = not current_enabled
-                self.setup_cog.save_configs()
-                
-                status = "enabled" if not current_enabled else "disabled"
-                embed = discord.Embed(
-                    title=f"✅ Reaction Roles {status.title()}!",
-                    description=f"Reaction role functionality has been {status}.\n"
-                               f"{'Use `/reactionroles` to set up role reactions.' if not current_enabled else ''}",
-                    color=0x00ff88 if not current_enabled else 0xff6600
-                )
-                
-                await interaction.response.edit_message(embed=embed, view=None)
-        
         embed = discord.Embed(
             title="🎭 Edit Reaction Roles",
             description=f"Reaction roles are currently: **{'Enabled' if current_enabled else 'Disabled'}**\n\n"
@@ -1324,8 +1286,111 @@ class SetupEditView(discord.ui.View):
             color=0x00ff88
         )
         
-        toggle_view = ReactionRolesToggleView(self.setup_cog, self.guild)
+        toggle_view = ReactionRolesToggleView(self.setup_cog, self.guild, current_enabled)
         await interaction.response.edit_message(embed=embed, view=toggle_view)
 
+class ChannelSelectView(discord.ui.View):
+    """Ranking channel picker shown by /setup_edit"""
+    
+    def __init__(self, setup_cog: SetupSystem, guild: discord.Guild, options: list):
+        super().__init__(timeout=60)
+        self.setup_cog = setup_cog
+        self.guild = guild
+        self.channel_select.options = options
+    
+    @discord.ui.select(placeholder="🏆 Choose new ranking channel...")
+    async def channel_select(self, interaction: discord.Interaction, select: discord.ui.Select):
+        new_channel_id = int(select.values[0])
+        new_channel = self.guild.get_channel(new_channel_id)
+        
+        # Update config
+        config = self.setup_cog.get_server_config(self.guild.id)
+        config['ranking_channel_id'] = new_channel_id
+        self.setup_cog.mark_dirty(self.guild.id)
+        
+        embed = discord.Embed(
+            title="✅ Ranking Channel Updated!",
+            description=f"Ranking channel changed to {new_channel.mention}",
+            color=0x00ff88
+        )
+        
+        await interaction.response.edit_message(embed=embed, view=None)
+
+class FeatureToggleView(discord.ui.View):
+    """Single enable/disable button for one feature flag in /setup_edit
+    
+    Subclasses name the feature key and the text for the button and result
+    embed; the button's label and style follow the current state.
+    """
+    
+    feature = ""
+    button_name = ""
+    result_name = ""
+    result_text = ""  # Formatted with the new status, e.g. "enabled"
+    
+    def __init__(self, setup_cog: SetupSystem, guild: discord.Guild, current_enabled: bool):
+        super().__init__(timeout=60)
+        self.setup_cog = setup_cog
+        self.guild = guild
+        self.current_enabled = current_enabled
+        action, self.toggle.style = _TOGGLE_BUTTON[bool(current_enabled)]
+        self.toggle.label = f"{action} {self.button_name}"
+    
+    def add_result_details(self, embed: discord.Embed, enabled: bool):
+        """Hook for subclasses to extend the result embed"""
+    
+    @discord.ui.button(label="Toggle")
+    async def toggle(self, interaction: discord.Interaction, button: discord.ui.Button):
+        enabled = not self.current_enabled
+        config = self.setup_cog.get_server_config(self.guild.id)
+        config.setdefault('features', {})[self.feature] = enabled
+        self.setup_cog.mark_dirty(self.guild.id)
+        
+        status = "enabled" if enabled else "disabled"
+        embed = discord.Embed(
+            title=f"✅ {self.result_name} {status.title()}!",
+            description=self.result_text.format(status=status),
+            color=0x00ff88 if enabled else 0xff6600
+        )
+        self.add_result_details(embed, enabled)
+        
+        await interaction.response.edit_message(embed=embed, view=None)
+
+class SuggestionsToggleView(FeatureToggleView):
+    feature = "suggestions"
+    button_name = "Suggestions"
+    result_name = "Suggestions"
+    result_text = "Suggestions system has been {status}."
+
+class WelcomeToggleView(FeatureToggleView):
+    feature = "welcome_messages"
+    button_name = "Welcome Messages"
+    result_name = "Welcome Messages"
+    result_text = "Welcome messages have been {status}."
+    
+    def add_result_details(self, embed: discord.Embed, enabled: bool):
+        if enabled:
+            embed.add_field(
+                name="💡 Next Steps:",
+                value="Use `/welcome_config` to customize your welcome messages!",
+                inline=False
+            )
+
+class TempVoiceToggleView(FeatureToggleView):
+    feature = "temp_voice"
+    button_name = "Temp Voice"
+    result_name = "Temp Voice"
+    result_text = "Temporary voice channels have been {status}."
+
+class ReactionRolesToggleView(FeatureToggleView):
+    feature = "reaction_roles"
+    button_name = "Reaction Roles"
+    result_name = "Reaction Roles"
+    result_text = "Reaction role functionality has been {status}.\n"
+    
+    def add_result_details(self, embed: discord.Embed, enabled: bool):
+        if enabled:
+            embed.description += "Use `/reactionroles` to set up role reactions."
+
 async def setup(bot):
     await bot.add_cog(SetupSystem(bot))
\ No newline at end of file
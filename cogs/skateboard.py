@@ -3,58 +3,86 @@ Skateboard Commands Cog
 Contains all skateboarding-related slash commands
 """
 
-import random
+from random import choice as _rand_choice
+import asyncio
+import copy
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
 import os
 import io
-import aiohttp
 import datetime
-import pytz
+import time
+from types import MappingProxyType
+from zoneinfo import ZoneInfo
 from utils.security import SecurityValidator, SecureError
 from utils.cache import bot_cache
 
-SKATE_TRICKS = [
+bot_logger = logging.getLogger('7ply_bot')
+
+SKATE_TRICKS = (
     "Kickflip", "Heelflip", "Ollie", "Shuvit", "Pop Shuvit", "Varial Kickflip", "Varial Heelflip", "Hardflip", "360 Flip",
     "Laserflip", "360 Pop Shuvit", "Inward Heelflip", "Nollie", "Fakie Bigspin", "Frontside 180", "Backside 180", "Manual", "Nose Manual",
     "Rail Stand", "No Comply", "Bluntslide", "Lipslide", "Boardslide", "50-50 Grind",
     "5-0 Grind", "Nosegrind", "Tailslide", "Crooked Grind", "Feeble Grind", "Smith Grind"
-]
+)
 
-# Custom tips and facts for specific tricks
-TRICK_TIPS = {
-    "360 Flip": {
-        "name": "💯 Fact",
-        "value": '360 Flips are also known as treflips.'
-    },
-    "Laserflip": {
-        "name": "💯 Fact", 
-        "value": "Laserflips are also known as 360 Heelflips."
-    },
-    "Kickflip": {
-        "name": "💯 Fact",
-        "value": 'The kickflip was originally called a "magic flip" when it was invented.'
-    },
-    "Ollie": {
-        "name": "💯 Fact",
-        "value": 'The ollie was invented by Alan "Ollie" Gelfand in 1978 and is the foundation of all skateboard tricks.'
-    },
-    "Hardflip": {
-        "name": "💡 Pro Tip",
-        "value": "Hardflips combine a heelflip with a frontside shuvit - master both tricks separately first!"
-    },
-    "Varial Kickflip": {
-        "name": "💡 Pro Tip", 
-        "value": "Varial kickflips combine a kickflip with a shuvit - practice the scoop and flick timing together."
-    },
-    "Inward Heelflip": {
-        "name": "💡 Pro Tip",
-        "value": "Inward heelflips rotate opposite to regular heelflips - use your toe to flick inward instead of heel out."
+# Custom tips and facts for specific tricks, as read-only (field name, field value) pairs
+TRICK_TIPS = MappingProxyType({
+    "360 Flip": ("💯 Fact", '360 Flips are also known as treflips.'),
+    "Laserflip": ("💯 Fact", "Laserflips are also known as 360 Heelflips."),
+    "Kickflip": ("💯 Fact", 'The kickflip was originally called a "magic flip" when it was invented.'),
+    "Ollie": ("💯 Fact", 'The ollie was invented by Alan "Ollie" Gelfand in 1978 and is the foundation of all skateboard tricks.'),
+    "Hardflip": ("💡 Pro Tip", "Hardflips combine a heelflip with a frontside shuvit - master both tricks separately first!"),
+    "Varial Kickflip": ("💡 Pro Tip", "Varial kickflips combine a kickflip with a shuvit - practice the scoop and flick timing together."),
+    "Inward Heelflip": ("💡 Pro Tip", "Inward heelflips rotate opposite to regular heelflips - use your toe to flick inward instead of heel out.")
+})
+
+_DEFAULT_TRICK_TIP = ("💡 Tip", "Practice makes perfect! Start with the basics and work your way up.")
+
+def _trick_embed_template(trick: str, tip: tuple) -> dict:
+    """Static part of the /trick embed: title, trick name, tip and footer"""
+    tip_name, tip_value = tip
+    return {
+        "title": "🛹 Random Trick Challenge!",
+        "description": f"**{trick}**",
+        "color": 0x00ff00,
+        "fields": [{"name": tip_name, "value": tip_value, "inline": False}],
+        "footer": {"text": "Keep shredding! 🤙"}
     }
-}
 
-SKATE_FACTS = [
+# Name fragments that mark single-image tricks and grind/slide tricks
+_SINGLE_IMAGE_TRICKS = ('manual', 'no comply', 'nose manual', 'rail stand')
+_GRIND_SLIDE_KEYWORDS = ('grind', 'slide', 'blunt', 'lipslide', 'boardslide', '50-50', '5-0', 'nosegrind', 'tailslide', 'crooked', 'feeble', 'smith')
+
+def _clean_trick_name(trick: str) -> str:
+    """Image filename stem for a trick (remove special chars, spaces to underscores, lowercase)"""
+    clean_trick = "".join(c for c in trick if c.isalnum() or c in (' ', '-')).rstrip()
+    return clean_trick.replace(' ', '_').lower()
+
+def _trick_image_type(trick: str) -> str:
+    """Control image layout for a trick: "single", "grind" (frontside/backside) or "stance" (regular/goofy)"""
+    lowered = trick.lower()
+    if any(single_trick in lowered for single_trick in _SINGLE_IMAGE_TRICKS):
+        return "single"
+    if any(keyword in lowered for keyword in _GRIND_SLIDE_KEYWORDS):
+        return "grind"
+    return "stance"
+
+# Each trick with its prebuilt embed template, image filename stem and image layout, resolved once at import
+_TRICK_POOL = tuple(
+    (
+        trick,
+        _trick_embed_template(trick, TRICK_TIPS.get(trick, _DEFAULT_TRICK_TIP)),
+        _clean_trick_name(trick),
+        _trick_image_type(trick)
+    )
+    for trick in SKATE_TRICKS
+)
+assert _TRICK_POOL and all(isinstance(trick, str) and trick for trick in SKATE_TRICKS), "Trick database is empty or invalid"
+
+SKATE_FACTS = (
     "The first skateboards were made in the 1940s by attaching roller skate wheels to wooden planks.",
     "The ollie was invented by Alan \"Ollie\" Gelfand in 1978.",
     "Skateboarding was banned in Norway from 1978 to 1989.",
@@ -70,10 +98,10 @@ SKATE_FACTS = [
     "Rodney Mullen is often called the 'Godfather of Street Skating'.",
     "Skateboard decks are typically made from 7-ply maple wood.",
     "The skateboard truck was invented in 1962 by Bill Richards."
-]
+)
 
 # Skateboard brand database - from legends to modern day
-SKATE_BRANDS = [
+SKATE_BRANDS = (
     {
         "name": "Powell Peralta",
         "founded": "1976",
@@ -257,10 +285,10 @@ SKATE_BRANDS = [
         "notable": "Swiss bearings, precision engineering, and industry standard quality",
         "fun_fact": "Bones Swiss bearings cost more than most complete skateboards but pros swear by them."
     }
-]
+)
 
 # Legendary skaters database - from pioneers to modern icons
-LEGENDARY_SKATERS = [
+LEGENDARY_SKATERS = (
     {
         "name": "Tony Hawk",
         "nickname": "The Birdman",
@@ -441,10 +469,10 @@ LEGENDARY_SKATERS = [
         "fun_fact": "Started skating professionally at age 7 and has dominated contests ever since.",
         "legacy": "Defines the modern contest skateboarding era and Olympic-level technical precision."
     }
-]
+)
 
 # Legendary skate crews database - from pioneering groups to modern collectives
-SKATE_CREWS = [
+SKATE_CREWS = (
     {
         "name": "Z-Boys (Zephyr Team)",
         "formed": "1975",
@@ -577,7 +605,313 @@ SKATE_CREWS = [
         "fun_fact": "The Berrics warehouse became skateboarding's first internet-famous indoor spot.",
         "legacy": "Defined how skateboarding would adapt to the internet and social media age."
     }
-]
+)
+
+def _brand_embed(brand_data: dict) -> discord.Embed:
+    """Build the /brand card for one brand record"""
+    embed = discord.Embed(
+        title=f"🏢 {brand_data['name']}",
+        description=brand_data['description'],
+        color=0x00ff00
+    )
+    
+    # Founded info
+    embed.add_field(
+        name="📅 Founded",
+        value=brand_data['founded'],
+        inline=True
+    )
+    
+    # Status info
+    status_emoji = "💀" if brand_data.get('defunct') else "✅"
+    status_text = f"{status_emoji} {brand_data['status']}"
+    embed.add_field(
+        name="📊 Status",
+        value=status_text,
+        inline=True
+    )
+    
+    # Location
+    embed.add_field(
+        name="🌍 Origin",
+        value=brand_data['location'],
+        inline=True
+    )
+    
+    # Notable info or legacy
+    if brand_data.get('notable'):
+        embed.add_field(
+            name="🌟 Notable For",
+            value=brand_data['notable'],
+            inline=False
+        )
+    
+    # Fun fact
+    if brand_data.get('fun_fact'):
+        embed.add_field(
+            name="💡 Fun Fact",
+            value=brand_data['fun_fact'],
+            inline=False
+        )
+    
+    embed.set_footer(text="Respect the brands that built the culture! 🙏")
+    return embed
+
+def _skater_embed(skater_data: dict) -> discord.Embed:
+    """Build the /skater card for one skater record"""
+    embed = discord.Embed(
+        title=f"🛹 {skater_data['name']}",
+        description=f"**\"{skater_data['nickname']}\"**\n{skater_data['legacy']}",
+        color=0x00ff00
+    )
+    
+    # Basic info
+    embed.add_field(
+        name="📅 Born",
+        value=skater_data['born'],
+        inline=True
+    )
+    
+    embed.add_field(
+        name="🦶 Stance", 
+        value=skater_data['stance'],
+        inline=True
+    )
+    
+    embed.add_field(
+        name="🎯 Style",
+        value=skater_data['style'],
+        inline=True
+    )
+    
+    # Career info
+    embed.add_field(
+        name="⏰ Active Years",
+        value=skater_data['active'],
+        inline=True
+    )
+    
+    embed.add_field(
+        name="🏆 Signature Trick",
+        value=skater_data['signature_trick'],
+        inline=True
+    )
+    
+    embed.add_field(
+        name="🎖️ Major Achievements", 
+        value=skater_data['achievements'],
+        inline=False
+    )
+    
+    # Fun fact
+    embed.add_field(
+        name="💡 Fun Fact",
+        value=skater_data['fun_fact'],
+        inline=False
+    )
+    
+    embed.set_footer(text="Legends never die, they inspire the next generation! 🙏")
+    return embed
+
+def _crew_embed(crew_data: dict) -> discord.Embed:
+    """Build the /crew card for one crew record"""
+    embed = discord.Embed(
+        title=f"👥 {crew_data['name']}",
+        description=f"**{crew_data['era']}**\n{crew_data['legacy']}",
+        color=0x00ff00
+    )
+    
+    # Basic info
+    embed.add_field(
+        name="📅 Formed",
+        value=crew_data['formed'],
+        inline=True
+    )
+    
+    embed.add_field(
+        name="🌍 Location",
+        value=crew_data['location'],
+        inline=True
+    )
+    
+    embed.add_field(
+        name="🎨 Style",
+        value=crew_data['style'],
+        inline=True
+    )
+    
+    # Members
+    embed.add_field(
+        name="⭐ Key Members",
+        value=crew_data['members'],
+        inline=False
+    )
+    
+    # Impact
+    embed.add_field(
+        name="🌟 Cultural Impact",
+        value=crew_data['impact'],
+        inline=False
+    )
+    
+    # Fun fact
+    embed.add_field(
+        name="💡 Fun Fact",
+        value=crew_data['fun_fact'],
+        inline=False
+    )
+    
+    embed.set_footer(text="Crews built the culture, one session at a time! 🤝")
+    return embed
+
+# Flick It control image folders under images/tricks, and the extensions tried in order
+_TRICK_IMAGE_ROOT = "images/tricks"
+_TRICK_IMAGE_FOLDERS = ("", "grinds", "regular", "goofy")
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+def _load_trick_images() -> dict:
+    """Read the control images into {folder: {file stem: (extension, bytes)}}, preferring extensions in _IMAGE_EXTENSIONS order"""
+    index = {}
+    for folder in _TRICK_IMAGE_FOLDERS:
+        folder_path = os.path.join(_TRICK_IMAGE_ROOT, folder)
+        found = {}
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext not in _IMAGE_EXTENSIONS or not entry.is_file():
+                        continue
+                    current = found.get(stem)
+                    if current is None or _IMAGE_EXTENSIONS.index(ext) < _IMAGE_EXTENSIONS.index(current):
+                        found[stem] = ext
+        except FileNotFoundError:
+            pass
+        
+        images = {}
+        for stem, ext in found.items():
+            with open(os.path.join(folder_path, f"{stem}{ext}"), 'rb') as f:
+                images[stem] = (ext, f.read())
+        index[folder] = images
+    return index
+
+# Fully static reference cards, built once at import and reused for every send
+_BRAND_EMBEDS = tuple(_brand_embed(record) for record in SKATE_BRANDS)
+_SKATER_EMBEDS = tuple(_skater_embed(record) for record in LEGENDARY_SKATERS)
+_CREW_EMBEDS = tuple(_crew_embed(record) for record in SKATE_CREWS)
+
+_TRICKLIST_EMBED = discord.Embed.from_dict({
+    "title": "🛹 Complete Trick List",
+    "description": "Here are all the tricks you can practice!",
+    "color": 0x00ff00,
+    "fields": [
+        {
+            "name": "🔰 Basic Tricks",
+            "value": "\n".join(f"• {trick}" for trick in SKATE_TRICKS[:5]),
+            "inline": True
+        },
+        {
+            "name": "⚡ Advanced Tricks",
+            "value": "\n".join(f"• {trick}" for trick in SKATE_TRICKS[5:20]),
+            "inline": True
+        },
+        {
+            "name": "🛹 Grinds & Slides",
+            "value": "\n".join(f"• {trick}" for trick in SKATE_TRICKS[20:]),
+            "inline": True
+        }
+    ],
+    "footer": {"text": f"Total tricks: {len(SKATE_TRICKS)} | Use /trick to get a random one!"}
+})
+
+_SKATEHISTORY_EMBED = discord.Embed.from_dict({
+    "title": "🛹 Skateboarding History Timeline",
+    "color": 0x00ff00,
+    "fields": [
+        {
+            "name": "1940s-1950s 🏄‍♂️",
+            "value": "Surfers in California create the first skateboards by attaching roller skate wheels to wooden planks, calling it 'sidewalk surfing'.",
+            "inline": False
+        },
+        {
+            "name": "1970s 🌊",
+            "value": "Urethane wheels are invented, revolutionizing skateboarding. The Z-Boys pioneer modern skateboarding style.",
+            "inline": False
+        },
+        {
+            "name": "1978 🚀",
+            "value": "Alan 'Ollie' Gelfand invents the ollie, the foundation of modern skateboarding tricks.",
+            "inline": False
+        },
+        {
+            "name": "1980s-1990s 📹",
+            "value": "Street skating develops. Skate videos become popular. Tony Hawk and others push the sport to new heights.",
+            "inline": False
+        },
+        {
+            "name": "2020 🏅",
+            "value": "Skateboarding makes its Olympic debut in Tokyo, cementing its place as a legitimate sport.",
+            "inline": False
+        }
+    ],
+    "footer": {"text": "From sidewalk surfing to Olympic sport! 🏆"}
+})
+
+# Base timestamp: 1 PM EST on a reference day (updated for current timezone)
+_RESET_BASE_TIMESTAMP = 1762106400  # 1 PM EST on 2025-11-02 (current reference)
+_SECONDS_PER_DAY = 24 * 60 * 60
+_SECONDS_PER_WEEK = 7 * _SECONDS_PER_DAY
+
+def _weekly_reset_base(base_timestamp: int) -> int:
+    """First Tuesday 1 PM reset at or after the reference timestamp"""
+    base_weekday = datetime.datetime.fromtimestamp(base_timestamp).weekday()  # 0=Monday, 1=Tuesday, etc.
+    days_to_tuesday = (1 - base_weekday) % 7
+    return base_timestamp + (days_to_tuesday * _SECONDS_PER_DAY)
+
+_WEEKLY_RESET_BASE_TIMESTAMP = _weekly_reset_base(_RESET_BASE_TIMESTAMP)
+
+def _next_reset(base_timestamp: int, period: int, current_timestamp: int) -> int:
+    """Next reset strictly after current_timestamp on a fixed schedule starting at base_timestamp"""
+    return base_timestamp + ((current_timestamp - base_timestamp) // period + 1) * period
+
+def _daily_reset_embed(timestamp: int) -> discord.Embed:
+    """Build the /daily embed for the given reset timestamp"""
+    embed = discord.Embed(
+        title="🗓️ Daily Mission Reset",
+        description=f"Daily missions reset at **<t:{timestamp}:t>**\n\nTime until reset: <t:{timestamp}:R>",
+        color=0x00ff88
+    )
+    
+    embed.add_field(
+        name="📅 Reset Schedule",
+        value=f"Daily missions reset every day at **<t:{timestamp}:t>**\n*(Automatically adjusts to your timezone)*",
+        inline=False
+    )
+    
+    embed.set_footer(text="Keep grinding those daily missions! 🛹")
+    return embed
+
+def _weekly_reset_embed(timestamp: int) -> discord.Embed:
+    """Build the /weekly embed for the given reset timestamp"""
+    embed = discord.Embed(
+        title="📅 Weekly Mission Reset",
+        description=f"Weekly missions reset at **<t:{timestamp}:t>**\n*(Automatically adjusts to your timezone)*\n\nTime until reset: <t:{timestamp}:R>",
+        color=0x00ff88
+    )
+    
+    embed.add_field(
+        name="🗓️ Reset Schedule",
+        value="Weekly missions reset every **Tuesday at 1:00 PM EST**",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="🎯 Pro Tip",
+        value="Weekly missions give bigger rewards! Make sure to complete them before Tuesday's reset.",
+        inline=False
+    )
+    
+    embed.set_footer(text="Keep grinding those weekly missions! 🛹")
+    return embed
 
 class SkateboardCommands(commands.Cog):
     """Skateboarding-related commands"""
@@ -585,7 +919,17 @@ class SkateboardCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         # EDT timezone
-        self.edt = pytz.timezone('America/New_York')
+        self.edt = ZoneInfo('America/New_York')
+        # Strong references to in-flight point awards so they aren't garbage collected
+        self._point_tasks = set()
+        # Last built /daily and /weekly embeds as (reset timestamp, embed)
+        self._reset_embeds = {}
+        # Control image bytes per folder, filled in cog_load
+        self.trick_images = {folder: {} for folder in _TRICK_IMAGE_FOLDERS}
+    
+    async def cog_load(self):
+        """Load the trick control images into memory off the event loop"""
+        self.trick_images = await asyncio.to_thread(_load_trick_images)
     
     def get_edt_now(self) -> datetime.datetime:
         """Get current time in EDT"""
@@ -598,133 +942,83 @@ class SkateboardCommands(commands.Cog):
             if ranking_cog:
                 points, ranked_up = ranking_cog.award_points(user_id, "trick_command")
                 return points, ranked_up
-        except Exception as e:
-            print(f"Error awarding trick points: {e}")
+        except Exception:
+            bot_logger.exception("Error awarding trick points")
         return 0, False
 
+    def schedule_trick_points(self, user_id: int):
+        """Award trick points in the background so the reply isn't held up by the ranking save"""
+        task = asyncio.create_task(self.award_trick_points(user_id))
+        self._point_tasks.add(task)
+        task.add_done_callback(self._point_tasks.discard)
+
     @app_commands.command(name='trick', description='Get a random skateboarding trick with Flick It controls!')
     async def trick(self, interaction: discord.Interaction):
         """Get a random skateboarding trick to practice with Flick It control images for both stances"""
         
         try:
             # Award points for using the command
-            await self.award_trick_points(interaction.user.id)
+            self.schedule_trick_points(interaction.user.id)
             
-            # Validate trick list exists and has content
-            if not SKATE_TRICKS:
-                await interaction.response.send_message(
-                    "❌ Trick database is empty! Contact an admin.",
-                    ephemeral=True
-                )
-                return
+            # The trick data is validated once at import
+            trick, embed_template, clean_trick, image_type = _rand_choice(_TRICK_POOL)
             
-            trick = random.choice(SKATE_TRICKS)
-            
-            # Validate trick selection
-            if not trick or not isinstance(trick, str):
-                await interaction.response.send_message(
-                    "❌ Invalid trick data! Contact an admin.",
-                    ephemeral=True
-                )
-                return
-            
-            embed = discord.Embed(
-                title="🛹 Random Trick Challenge!",
-                description=f"**{trick}**",
-                color=0x00ff00
-            )
-            
-            # Use custom tip if available, otherwise use default
-            if trick in TRICK_TIPS:
-                tip_data = TRICK_TIPS[trick]
-                embed.add_field(
-                    name=tip_data["name"],
-                    value=tip_data["value"],
-                    inline=False
-                )
-            else:
-                embed.add_field(
-                    name="💡 Tip", 
-                    value="Practice makes perfect! Start with the basics and work your way up.", 
-                    inline=False
-                )
+            # Title, custom (or default) tip and footer come prebuilt per trick
+            embed = discord.Embed.from_dict(copy.deepcopy(embed_template))
             
             # Check for control sequence images 
             files = []
             top_right_image = None  # Thumbnail position
             bottom_image = None     # Main image position
-            image_type = ""
-            
-            # Clean trick name for filename (remove spaces, special chars)
-            clean_trick = "".join(c for c in trick if c.isalnum() or c in (' ', '-')).rstrip()
-            clean_trick = clean_trick.replace(' ', '_').lower()
-            
-            # Check for both PNG and JPG formats
-            image_extensions = ['.png', '.jpg', '.jpeg']
             
-            # Determine trick type and find images
-            grind_slide_keywords = ['grind', 'slide', 'blunt', 'lipslide', 'boardslide', '50-50', '5-0', 'nosegrind', 'tailslide', 'crooked', 'feeble', 'smith']
-            is_grind_slide = any(keyword in trick.lower() for keyword in grind_slide_keywords)
+            # Control images loaded into memory at cog load (PNG preferred over JPG)
+            trick_images = self.trick_images
             
             # Try to find control images - fail silently if images missing
-            # Special tricks that have single images in the main tricks folder
-            single_image_tricks = ['manual', 'no comply', 'nose manual', 'rail stand']
-            is_single_image = any(single_trick in trick.lower() for single_trick in single_image_tricks)
-            
-            if is_single_image:
+            # Image filename stem and layout (single/grind/stance) are precomputed per trick
+            if image_type == "single":
                 # Look for single image in main tricks folder
-                for ext in image_extensions:
-                    single_path = f"images/tricks/{clean_trick}{ext}"
-                    if os.path.exists(single_path):
-                        single_filename = f"{clean_trick}{ext}"
-                        bottom_image = discord.File(single_path, filename=single_filename)
-                        files.append(bottom_image)
-                        break
-                
-                image_type = "single"
-            elif is_grind_slide:
+                image = trick_images[""].get(clean_trick)
+                if image:
+                    ext, data = image
+                    single_filename = f"{clean_trick}{ext}"
+                    bottom_image = discord.File(io.BytesIO(data), filename=single_filename)
+                    files.append(bottom_image)
+            elif image_type == "grind":
                 # Clean grind name by removing common suffixes
                 grind_name = clean_trick.replace('_grind', '').replace('_slide', '')
                 
                 # Look for frontside image (goes top-right like regular stance)
-                for ext in image_extensions:
-                    fs_path = f"images/tricks/grinds/fs_{grind_name}{ext}"
-                    if os.path.exists(fs_path):
-                        fs_filename = f"fs_{grind_name}{ext}"
-                        top_right_image = discord.File(fs_path, filename=fs_filename)
-                        files.append(top_right_image)
-                        break
+                image = trick_images["grinds"].get(f"fs_{grind_name}")
+                if image:
+                    ext, data = image
+                    fs_filename = f"fs_{grind_name}{ext}"
+                    top_right_image = discord.File(io.BytesIO(data), filename=fs_filename)
+                    files.append(top_right_image)
                 
                 # Look for backside image (goes bottom like goofy stance)
-                for ext in image_extensions:
-                    bs_path = f"images/tricks/grinds/bs_{grind_name}{ext}"
-                    if os.path.exists(bs_path):
-                        bs_filename = f"bs_{grind_name}{ext}"
-                        bottom_image = discord.File(bs_path, filename=bs_filename)
-                        files.append(bottom_image)
-                        break
-                
-                image_type = "grind"
+                image = trick_images["grinds"].get(f"bs_{grind_name}")
+                if image:
+                    ext, data = image
+                    bs_filename = f"bs_{grind_name}{ext}"
+                    bottom_image = discord.File(io.BytesIO(data), filename=bs_filename)
+                    files.append(bottom_image)
             else:
                 # Look for regular stance image (goes top-right)
-                for ext in image_extensions:
-                    regular_path = f"images/tricks/regular/{clean_trick}{ext}"
-                    if os.path.exists(regular_path):
-                        regular_filename = f"{clean_trick}_regular{ext}"
-                        top_right_image = discord.File(regular_path, filename=regular_filename)
-                        files.append(top_right_image)
-                        break
+                image = trick_images["regular"].get(clean_trick)
+                if image:
+                    ext, data = image
+                    regular_filename = f"{clean_trick}_regular{ext}"
+                    top_right_image = discord.File(io.BytesIO(data), filename=regular_filename)
+                    files.append(top_right_image)
                 
                 # Look for goofy stance image (goes bottom)
-                for ext in image_extensions:
-                    goofy_path = f"images/tricks/goofy/{clean_trick}{ext}"
-                    if os.path.exists(goofy_path):
-                        goofy_filename = f"{clean_trick}_goofy{ext}"
-                        bottom_image = discord.File(goofy_path, filename=goofy_filename)
-                        files.append(bottom_image)
-                        break
-                
-                image_type = "stance"
+                image = trick_images["goofy"].get(clean_trick)
+                if image:
+                    ext, data = image
+                    goofy_filename = f"{clean_trick}_goofy{ext}"
+                    bottom_image = discord.File(io.BytesIO(data), filename=goofy_filename)
+                    files.append(bottom_image)
             
             # Set images in embed (top-right image as thumbnail, bottom image as main)
             if top_right_image:
@@ -786,16 +1080,14 @@ class SkateboardCommands(commands.Cog):
                     inline=False
                 )
             
-            embed.set_footer(text="Keep shredding! 🤙")
-            
             if files:
                 await interaction.response.send_message(embed=embed, files=files)
             else:
                 await interaction.response.send_message(embed=embed)
                 
-        except Exception as e:
+        except Exception:
             # Log error but send user-friendly message
-            print(f"Error in trick command: {e}")
+            bot_logger.exception("Error in trick command")
             
             # Fallback response
             await interaction.response.send_message(
@@ -806,44 +1098,14 @@ class SkateboardCommands(commands.Cog):
     @app_commands.command(name='tricklist', description='Show all available skateboarding tricks')
     async def tricklist(self, interaction: discord.Interaction):
         """Display a list of all skateboarding tricks"""
-        basic_tricks = SKATE_TRICKS[:5]
-        advanced_tricks = SKATE_TRICKS[5:20]
-        grinds_slides = SKATE_TRICKS[20:]
-        
-        embed = discord.Embed(
-            title="🛹 Complete Trick List",
-            description="Here are all the tricks you can practice!",
-            color=0x00ff00
-        )
-        
-        embed.add_field(
-            name="🔰 Basic Tricks",
-            value="\n".join([f"• {trick}" for trick in basic_tricks]),
-            inline=True
-        )
-        
-        embed.add_field(
-            name="⚡ Advanced Tricks", 
-            value="\n".join([f"• {trick}" for trick in advanced_tricks]),
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🛹 Grinds & Slides",
-            value="\n".join([f"• {trick}" for trick in grinds_slides]),
-            inline=True
-        )
-        
-        embed.set_footer(text=f"Total tricks: {len(SKATE_TRICKS)} | Use /trick to get a random one!")
-        
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=_TRICKLIST_EMBED)
 
     @app_commands.command(name='skatefact', description='Learn a random skateboarding fact!')
     async def skatefact(self, interaction: discord.Interaction):
         """Get a random skateboarding fact"""
         try:
             # Award points for using the command
-            await self.award_trick_points(interaction.user.id)
+            self.schedule_trick_points(interaction.user.id)
             
             # Validate facts list exists
             if not SKATE_FACTS:
@@ -853,7 +1115,7 @@ class SkateboardCommands(commands.Cog):
                 )
                 return
             
-            fact = random.choice(SKATE_FACTS)
+            fact = _rand_choice(SKATE_FACTS)
             
             # Validate fact selection
             if not fact or not isinstance(fact, str):
@@ -872,8 +1134,8 @@ class SkateboardCommands(commands.Cog):
             
             await interaction.response.send_message(embed=embed)
         
-        except Exception as e:
-            print(f"Error in skatefact command: {e}")
+        except Exception:
+            bot_logger.exception("Error in skatefact command")
             await interaction.response.send_message(
                 "❌ Something went wrong getting your fact! Try again in a moment.",
                 ephemeral=True
@@ -882,197 +1144,37 @@ class SkateboardCommands(commands.Cog):
     @app_commands.command(name='skatehistory', description='Learn about skateboarding history')
     async def skatehistory(self, interaction: discord.Interaction):
         """Get an overview of skateboarding history"""
-        embed = discord.Embed(
-            title="🛹 Skateboarding History Timeline",
-            color=0x00ff00
-        )
-        
-        embed.add_field(
-            name="1940s-1950s 🏄‍♂️",
-            value="Surfers in California create the first skateboards by attaching roller skate wheels to wooden planks, calling it 'sidewalk surfing'.",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="1970s 🌊", 
-            value="Urethane wheels are invented, revolutionizing skateboarding. The Z-Boys pioneer modern skateboarding style.",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="1978 🚀",
-            value="Alan 'Ollie' Gelfand invents the ollie, the foundation of modern skateboarding tricks.",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="1980s-1990s 📹",
-            value="Street skating develops. Skate videos become popular. Tony Hawk and others push the sport to new heights.",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="2020 🏅",
-            value="Skateboarding makes its Olympic debut in Tokyo, cementing its place as a legitimate sport.",
-            inline=False
-        )
-        
-        embed.set_footer(text="From sidewalk surfing to Olympic sport! 🏆")
-        
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=_SKATEHISTORY_EMBED)
 
     @app_commands.command(name='daily', description='Check when daily missions reset (1 PM EST)')
     async def daily_reset(self, interaction: discord.Interaction):
-        # Base timestamp: 1 PM EST on a reference day (updated for current timezone)
-        base_timestamp = 1762106400  # 1 PM EST on 2025-11-02 (current reference)
-        current_timestamp = int(self.get_edt_now().timestamp())
+        timestamp = _next_reset(_RESET_BASE_TIMESTAMP, _SECONDS_PER_DAY, int(time.time()))
         
-        # Calculate seconds in a day
-        seconds_per_day = 24 * 60 * 60
+        # Reuse the embed until the reset it shows has passed
+        cached = self._reset_embeds.get('daily')
+        if cached is None or cached[0] != timestamp:
+            cached = self._reset_embeds['daily'] = (timestamp, _daily_reset_embed(timestamp))
         
-        # Find how many days have passed since the base timestamp
-        days_since_base = (current_timestamp - base_timestamp) // seconds_per_day
-        
-        # Calculate today's reset time
-        today_reset = base_timestamp + (days_since_base * seconds_per_day)
-        
-        # If we're past today's reset, use tomorrow's reset
-        if current_timestamp >= today_reset:
-            timestamp = today_reset + seconds_per_day
-        else:
-            timestamp = today_reset
-        
-        embed = discord.Embed(
-            title="🗓️ Daily Mission Reset",
-            description=f"Daily missions reset at **<t:{timestamp}:t>**\n\nTime until reset: <t:{timestamp}:R>",
-            color=0x00ff88
-        )
-        
-        embed.add_field(
-            name="📅 Reset Schedule",
-            value=f"Daily missions reset every day at **<t:{timestamp}:t>**\n*(Automatically adjusts to your timezone)*",
-            inline=False
-        )
-        
-        
-        embed.set_footer(text="Keep grinding those daily missions! 🛹")
-        
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=cached[1])
 
     @app_commands.command(name='weekly', description='Check when weekly missions reset (Tuesdays at 1 PM EST)')
     async def weekly_reset(self, interaction: discord.Interaction):
-        # Base timestamp: 1 PM EST on a reference day (updated for current timezone)
-        base_timestamp = 1762106400  # 1 PM EST on 2025-11-02 (current reference)
-        current_timestamp = int(self.get_edt_now().timestamp())
-        
-        # Calculate seconds in a day and week
-        seconds_per_day = 24 * 60 * 60
-        seconds_per_week = 7 * seconds_per_day
-        
-        # Find the base date and what day of week it was
-        base_date = datetime.datetime.fromtimestamp(base_timestamp)
-        base_weekday = base_date.weekday()  # 0=Monday, 1=Tuesday, etc.
+        timestamp = _next_reset(_WEEKLY_RESET_BASE_TIMESTAMP, _SECONDS_PER_WEEK, int(time.time()))
         
-        # Calculate days since base timestamp
-        days_since_base = (current_timestamp - base_timestamp) // seconds_per_day
+        # Reuse the embed until the reset it shows has passed
+        cached = self._reset_embeds.get('weekly')
+        if cached is None or cached[0] != timestamp:
+            cached = self._reset_embeds['weekly'] = (timestamp, _weekly_reset_embed(timestamp))
         
-        # Find the most recent Tuesday at 1 PM
-        # If base was not a Tuesday, adjust to find the Tuesday pattern
-        if base_weekday != 1:  # If base wasn't Tuesday
-            # Find how many days to add/subtract to get to Tuesday
-            days_to_tuesday = (1 - base_weekday) % 7
-            tuesday_base = base_timestamp + (days_to_tuesday * seconds_per_day)
-        else:
-            tuesday_base = base_timestamp
-        
-        # Find how many weeks have passed since the Tuesday base
-        weeks_since_tuesday_base = (current_timestamp - tuesday_base) // seconds_per_week
-        
-        # Calculate this week's Tuesday reset
-        this_tuesday_reset = tuesday_base + (weeks_since_tuesday_base * seconds_per_week)
-        
-        # If we're past this Tuesday's reset, use next Tuesday's reset
-        if current_timestamp >= this_tuesday_reset:
-            timestamp = this_tuesday_reset + seconds_per_week
-        else:
-            timestamp = this_tuesday_reset
-        
-        embed = discord.Embed(
-            title="📅 Weekly Mission Reset",
-            description=f"Weekly missions reset at **<t:{timestamp}:t>**\n*(Automatically adjusts to your timezone)*\n\nTime until reset: <t:{timestamp}:R>",
-            color=0x00ff88
-        )
-        
-        embed.add_field(
-            name="🗓️ Reset Schedule",
-            value="Weekly missions reset every **Tuesday at 1:00 PM EST**",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🎯 Pro Tip",
-            value="Weekly missions give bigger rewards! Make sure to complete them before Tuesday's reset.",
-            inline=False
-        )
-        
-        embed.set_footer(text="Keep grinding those weekly missions! 🛹")
-        
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=cached[1])
 
     @app_commands.command(name='brand', description='Learn about skateboard brand history and culture')
     async def brand(self, interaction: discord.Interaction):
         """Get information about skateboard brands - legends, history, and culture"""
         # Award points for using the command
-        await self.award_trick_points(interaction.user.id)
-        
-        brand_data = random.choice(SKATE_BRANDS)
-        
-        embed = discord.Embed(
-            title=f"🏢 {brand_data['name']}",
-            description=brand_data['description'],
-            color=0x00ff00
-        )
-        
-        # Founded info
-        embed.add_field(
-            name="📅 Founded",
-            value=brand_data['founded'],
-            inline=True
-        )
+        self.schedule_trick_points(interaction.user.id)
         
-        # Status info
-        status_emoji = "💀" if brand_data.get('defunct') else "✅"
-        status_text = f"{status_emoji} {brand_data['status']}"
-        embed.add_field(
-            name="📊 Status",
-            value=status_text,
-            inline=True
-        )
-        
-        # Location
-        embed.add_field(
-            name="🌍 Origin",
-            value=brand_data['location'],
-            inline=True
-        )
-        
-        # Notable info or legacy
-        if brand_data.get('notable'):
-            embed.add_field(
-                name="🌟 Notable For",
-                value=brand_data['notable'],
-                inline=False
-            )
-        
-        # Fun fact
-        if brand_data.get('fun_fact'):
-            embed.add_field(
-                name="💡 Fun Fact",
-                value=brand_data['fun_fact'],
-                inline=False
-            )
-        
-        embed.set_footer(text="Respect the brands that built the culture! 🙏")
+        embed = _rand_choice(_BRAND_EMBEDS)
         
         await interaction.response.send_message(embed=embed)
 
@@ -1080,62 +1182,9 @@ class SkateboardCommands(commands.Cog):
     async def skater(self, interaction: discord.Interaction):
         """Get detailed information about legendary skateboarders throughout history"""
         # Award points for using the command
-        await self.award_trick_points(interaction.user.id)
-        
-        skater_data = random.choice(LEGENDARY_SKATERS)
-        
-        embed = discord.Embed(
-            title=f"🛹 {skater_data['name']}",
-            description=f"**\"{skater_data['nickname']}\"**\n{skater_data['legacy']}",
-            color=0x00ff00
-        )
-        
-        # Basic info
-        embed.add_field(
-            name="📅 Born",
-            value=skater_data['born'],
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🦶 Stance", 
-            value=skater_data['stance'],
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🎯 Style",
-            value=skater_data['style'],
-            inline=True
-        )
-        
-        # Career info
-        embed.add_field(
-            name="⏰ Active Years",
-            value=skater_data['active'],
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🏆 Signature Trick",
-            value=skater_data['signature_trick'],
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🎖️ Major Achievements", 
-            value=skater_data['achievements'],
-            inline=False
-        )
-        
-        # Fun fact
-        embed.add_field(
-            name="💡 Fun Fact",
-            value=skater_data['fun_fact'],
-            inline=False
-        )
+        self.schedule_trick_points(interaction.user.id)
         
-        embed.set_footer(text="Legends never die, they inspire the next generation! 🙏")
+        embed = _rand_choice(_SKATER_EMBEDS)
         
         await interaction.response.send_message(embed=embed)
 
@@ -1143,57 +1192,9 @@ class SkateboardCommands(commands.Cog):
     async def crew(self, interaction: discord.Interaction):
         """Get detailed information about legendary skateboard crews and teams throughout history"""
         # Award points for using the command
-        await self.award_trick_points(interaction.user.id)
-        
-        crew_data = random.choice(SKATE_CREWS)
-        
-        embed = discord.Embed(
-            title=f"👥 {crew_data['name']}",
-            description=f"**{crew_data['era']}**\n{crew_data['legacy']}",
-            color=0x00ff00
-        )
-        
-        # Basic info
-        embed.add_field(
-            name="📅 Formed",
-            value=crew_data['formed'],
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🌍 Location",
-            value=crew_data['location'],
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🎨 Style",
-            value=crew_data['style'],
-            inline=True
-        )
-        
-        # Members
-        embed.add_field(
-            name="⭐ Key Members",
-            value=crew_data['members'],
-            inline=False
-        )
-        
-        # Impact
-        embed.add_field(
-            name="🌟 Cultural Impact",
-            value=crew_data['impact'],
-            inline=False
-        )
-        
-        # Fun fact
-        embed.add_field(
-            name="💡 Fun Fact",
-            value=crew_data['fun_fact'],
-            inline=False
-        )
+        self.schedule_trick_points(interaction.user.id)
         
-        embed.set_footer(text="Crews built the culture, one session at a time! 🤝")
+        embed = _rand_choice(_CREW_EMBEDS)
         
         await interaction.response.send_message(embed=embed)
 
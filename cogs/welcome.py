@@ -2,8 +2,22 @@ from discord.ext import commands
 import discord
 import json
 import os
+import string
 from typing import Optional
 
+# Placeholders a custom welcome message template may use - kept in sync with /welcome_set_message
+_ALLOWED_PLACEHOLDERS = frozenset({"user", "user_name", "server", "member_count", "date"})
+
+def _render_template(template: str, **values) -> Optional[str]:
+    """Render a custom welcome template, or return None if it isn't a valid plain-placeholder template"""
+    try:
+        for _, field_name, format_spec, conversion in string.Formatter().parse(template):
+            if field_name is not None and (field_name not in _ALLOWED_PLACEHOLDERS or format_spec or conversion):
+                return None
+        return template.format(**values)
+    except (ValueError, AttributeError, IndexError, KeyError):
+        return None
+
 class WelcomeHandler(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -82,16 +96,21 @@ class WelcomeHandler(commands.Cog):
         
         # Build the welcome message
         custom_message = welcome_config.get("custom_message")
+        message_content = None
         if custom_message:
-            # Use custom message template
-            message_content = custom_message.format(
+            # Use custom message template - stored templates that can't be rendered fall back to the default
+            message_content = _render_template(
+                custom_message,
                 user=member.mention if welcome_config.get("ping_user", True) else member.display_name,
                 user_name=member.display_name,
                 server=member.guild.name,
                 member_count=member.guild.member_count,
                 date=member.joined_at.strftime("%B %d, %Y") if member.joined_at else "Today"
             )
-        else:
+            if message_content is None:
+                print(f"⚠️ Invalid custom welcome template in {member.guild.name} - using the default message")
+                custom_message = None
+        if message_content is None:
             # Use default skateboard-themed message
             ping = member.mention if welcome_config.get("ping_user", True) else member.display_name
             message_content = f"🛹 Welcome to {member.guild.name}, {ping}! Ready to shred with us?\n\nUse `/trick` to get random tricks, `/skatefact` to learn skate history, and start earning your ranks by chatting! Stay radical! 🤙"